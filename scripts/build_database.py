@@ -86,6 +86,7 @@ ATTRIBUTE_TO_COLUMN: dict[str, tuple[str, Any]] = {
     "Current - Continuous Drain(Id)": ("id_max_a", parse_current),
     "RDS(on)": ("rds_on_ohms", parse_resistance),
     "Total Gate Charge(Qg)": ("qg_nc", parse_capacitance),  # Stored in Coulombs
+    "Gate Charge(Qg)": ("qg_nc", parse_capacitance),
 
     # Diodes
     "Voltage - Forward(Vf@If)": ("vf_v", parse_voltage),
@@ -106,6 +107,7 @@ ATTRIBUTE_TO_COLUMN: dict[str, tuple[str, Any]] = {
 
     # ADC/DAC
     "Resolution(Bits)": ("resolution_bits", parse_integer),
+    "Resolution (Bits)": ("resolution_bits", parse_integer),
     "Number of Bits": ("resolution_bits", parse_integer),
     "Sampling Rate": ("sample_rate_hz", parse_frequency),
 
@@ -123,6 +125,7 @@ ATTRIBUTE_TO_COLUMN: dict[str, tuple[str, Any]] = {
     "Slew Rate": ("slew_rate_vus", parse_voltage),  # V/µs
     "Input Offset Voltage": ("vos_uv", parse_voltage),
     "Common Mode Rejection Ratio(CMRR)": ("cmrr_db", parse_decibels),
+    "Common Mode Rejection Ratio (CMRR)": ("cmrr_db", parse_decibels),
 
     # Capacitors (electrolytic)
     "Ripple Current": ("ripple_current_a", parse_current),
@@ -184,6 +187,7 @@ ATTRIBUTE_TO_COLUMN: dict[str, tuple[str, Any]] = {
 
     # Power / Efficiency
     "Efficiency": ("efficiency_pct", parse_percentage),
+    "Conversion Efficiency": ("efficiency_pct", parse_percentage),
 }
 
 
@@ -364,6 +368,11 @@ def build_database(data_dir: Path, db_path: Path, verbose: bool = True) -> dict:
             package TEXT,
             stock INTEGER,
             library_type TEXT CHECK(library_type IN ('b', 'p', 'e')),
+            -- Sort rank for prefer_no_fee ordering (basic, preferred, extended);
+            -- computed by SQLite so the ORDER BY can be served from an index
+            library_type_order INTEGER GENERATED ALWAYS AS (
+                CASE library_type WHEN 'b' THEN 1 WHEN 'p' THEN 2 ELSE 3 END
+            ) VIRTUAL,
             subcategory_id INTEGER,
             price REAL,
             description TEXT,
@@ -507,6 +516,12 @@ def build_database(data_dir: Path, db_path: Path, verbose: bool = True) -> dict:
     conn.execute("CREATE INDEX idx_subcat_stock ON components(subcategory_id, stock)")
     conn.execute("CREATE INDEX idx_subcat_libtype ON components(subcategory_id, library_type)")
 
+    # Default (prefer_no_fee) ordering: basic/preferred first, then stock, read in index order
+    conn.execute("CREATE INDEX idx_ltorder_stock ON components(library_type_order, stock DESC)")
+    conn.execute(
+        "CREATE INDEX idx_subcat_ltorder_stock ON components(subcategory_id, library_type_order, stock DESC)"
+    )
+
     # Indexes for numeric columns (partial indexes for non-NULL values)
     if verbose:
         print("Creating numeric column indexes...")
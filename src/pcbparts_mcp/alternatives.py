@@ -7,6 +7,7 @@ This module provides intelligent alternative finding that:
 4. Returns verified alternatives for supported categories, similar_parts for unsupported
 """
 
+from itertools import islice
 from typing import Any, Callable
 
 # Import shared parsers from the unified parsers module
@@ -1122,6 +1123,26 @@ COMPATIBILITY_RULES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Rules compiled once at import for is_compatible_alternative():
+# subcategory -> (must_match specs, (spec, direction, parser) triples).
+# Non-callable parsers ("special" or missing) are stored as None.
+_CompiledRules = tuple[
+    tuple[str, ...],
+    tuple[tuple[str, str, Callable[[str], float | None] | None], ...],
+]
+_COMPILED_RULES: dict[str, _CompiledRules] = {
+    subcategory: (
+        tuple(rules.get("must_match", ())),
+        tuple(
+            (spec, direction, parser if callable(parser) else None)
+            for spec, direction in rules.get("same_or_better", {}).items()
+            for parser in (SPEC_PARSERS.get(spec),)
+        ),
+    )
+    for subcategory, rules in COMPATIBILITY_RULES.items()
+    if rules
+}
+
 
 # =============================================================================
 # PIN COUNT NORMALIZATION (for connectors)
@@ -1237,9 +1258,10 @@ def is_compatible_alternative(
     Returns (is_compatible, verification_info) tuple.
     verification_info contains specs_verified and specs_unparseable lists.
     """
-    rules = COMPATIBILITY_RULES.get(subcategory)
-    if not rules:
+    compiled = _COMPILED_RULES.get(subcategory)
+    if compiled is None:
         return True, {"specs_verified": [], "specs_unparseable": []}
+    must_match, same_or_better = compiled
 
     orig_specs = original.get("specs", {})
     cand_specs = candidate.get("specs", {})
@@ -1248,7 +1270,7 @@ def is_compatible_alternative(
     specs_unparseable: list[str] = []
 
     # Check must_match specs (exact equality required)
-    for spec in rules.get("must_match", []):
+    for spec in must_match:
         orig_val = orig_specs.get(spec)
         cand_val = cand_specs.get(spec)
         if orig_val and cand_val:
@@ -1262,12 +1284,11 @@ def is_compatible_alternative(
             specs_unparseable.append(spec)  # One side missing
 
     # Check same_or_better specs
-    for spec, direction in rules.get("same_or_better", {}).items():
+    for spec, direction, parser in same_or_better:
         orig_val = orig_specs.get(spec)
         cand_val = cand_specs.get(spec)
         if orig_val and cand_val:
-            parser = SPEC_PARSERS.get(spec)
-            if parser and parser != "special" and callable(parser):
+            if parser is not None:
                 if parser(orig_val) is not None and parser(cand_val) is not None:
                     if not _spec_ok(orig_val, cand_val, spec, direction):
                         return False, {
@@ -1510,8 +1531,9 @@ def build_unsupported_response(
     """Build response for unsupported subcategories - similar parts, not alternatives."""
     similar = scored_parts[:limit]
 
-    # Use attribute names from original part for verification guidance
-    specs_to_verify = list(original.get("specs", {}).keys())
+    # Use the first 5 attribute names from original part for verification guidance
+    # (specs keys are non-empty names, so stop as soon as 5 are collected)
+    specs_to_verify = list(islice(original.get("specs", {}), 5))
     original_pkg = original.get("package", "")
 
     similar_parts_output = []
@@ -1546,9 +1568,9 @@ def build_unsupported_response(
         },
         "manual_comparison": {
             "original_specs": original.get("specs", {}),
-            "specs_to_verify": specs_to_verify[:5],
+            "specs_to_verify": specs_to_verify,
             "guidance": (
-                f"Compare these specs manually: {', '.join(specs_to_verify[:5])}"
+                f"Compare these specs manually: {', '.join(specs_to_verify)}"
                 if specs_to_verify
                 else "Review datasheets for compatibility"
             ),
@@ -1,11 +1,14 @@
 """JLCPCB API client for searching electronic components."""
 
 import asyncio
+import functools
 import heapq
+import json
 import logging
 import re
 import time
-from typing import Any, Literal
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Literal
 from urllib.parse import quote
 
 import wafer
@@ -14,7 +17,6 @@ from wafer import (
     ConnectionFailed,
     EmptyResponse,
     RateLimited,
-    WaferHTTPError,
     WaferTimeout,
 )
 
@@ -34,6 +36,8 @@ from .config import (
     JLCPCB_RATE_LIMIT,
     JLCPCB_RATE_JITTER,
     JLCPCB_MAX_ROTATIONS,
+    JLCPCB_RESPONSE_CACHE_TTL,
+    JLCPCB_RESPONSE_CACHE_MAX_SIZE,
     MAX_RETRIES,
     REQUEST_TIMEOUT,
     DEFAULT_PAGE_SIZE,
@@ -42,10 +46,12 @@ from .config import (
     MAX_ALTERNATIVES,
     PART_CACHE_TTL,
     PART_CACHE_MAX_SIZE,
+    CATEGORY_REFRESH_INTERVAL,
 )
 from .subcategory_aliases import SUBCATEGORY_ALIASES, resolve_subcategory_name as _resolve_subcategory_name
 from .manufacturer_aliases import KNOWN_MANUFACTURERS, MANUFACTURER_ALIASES
 from .mounting import detect_mounting_type
+from .search.mpn import LCSC_PATTERN
 from .alternatives import (
     COMPATIBILITY_RULES,
     is_compatible_alternative,
@@ -61,6 +67,7 @@ logger = logging.getLogger(__name__)
 _UUID_PATTERN = re.compile(r'^[0-9a-f]{32}$', re.IGNORECASE)
 
 
+
 def _normalize_manufacturer_name(name: str) -> str:
     """Normalize manufacturer name for matching: lowercase, remove punctuation, collapse spaces."""
     normalized = re.sub(r'[.,\-\(\)&]', ' ', name.lower())  # Replace punctuation with space
@@ -98,6 +105,67 @@ _MANUFACTURER_EXACT_NORMALIZED: dict[str, str] = {
     _normalize_manufacturer_name(name): name for name in KNOWN_MANUFACTURERS
 }
 
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_manufacturer_name(name: str) -> str:
+    """Resolve manufacturer alias to full name.
+
+    Lookup order:
+    1. Check aliases exactly (case-insensitive)
+    2. Check exact manufacturer names (case-insensitive)
+    3. Check aliases with normalized punctuation
+    4. Check manufacturer names with normalized punctuation
+    5. Return original name unchanged
+
+    Alias tables are static for the process lifetime, so results are memoized.
+    """
+    name_lower = name.lower()
+    # Check aliases first (abbreviations and alternate names)
+    if name_lower in MANUFACTURER_ALIASES:
+        return MANUFACTURER_ALIASES[name_lower]
+    # Check if it matches a known manufacturer name (case-insensitive)
+    if name_lower in _MANUFACTURER_EXACT_NAMES:
+        return _MANUFACTURER_EXACT_NAMES[name_lower]
+    # Try normalized matching (ignore punctuation like . , - & etc)
+    name_normalized = _normalize_manufacturer_name(name)
+    if name_normalized in _MANUFACTURER_ALIASES_NORMALIZED:
+        return _MANUFACTURER_ALIASES_NORMALIZED[name_normalized]
+    if name_normalized in _MANUFACTURER_EXACT_NORMALIZED:
+        return _MANUFACTURER_EXACT_NORMALIZED[name_normalized]
+    # Return original unchanged
+    return name
+
+
+# Per-request headers for JLCPCB API calls (built once; wafer only reads them
+# and layers them over its rotating fingerprint/User-Agent headers)
+_JLCPCB_REQUEST_HEADERS: dict[str, str] = {
+    "Origin": "https://jlcpcb.com",
+    "Referer": "https://jlcpcb.com/parts",
+    "Sec-Fetch-Site": "same-origin",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Dest": "empty",
+}
+
+# Search API params per library_type filter. no_fee adds nothing here: it is
+# handled in _search_items with two API calls (basic + preferred).
+_LIBRARY_TYPE_PARAMS: dict[str, dict[str, Any]] = {
+    "basic": {"componentLibraryType": "base"},
+    "extended": {"componentLibraryType": "expand"},
+    "preferred": {"preferredComponentFlag": True},
+    "no_fee": {},
+}
+
+# JLCPCB componentLibraryType -> our library_type (unknown values pass through)
+_LIB_TYPE_MAP: dict[str, str] = {"base": "basic", "expand": "extended"}
+
+# Post-filters for find_alternatives library_type option (allocated once)
+_LIBRARY_TYPE_PREDICATES: dict[str, Callable[[dict[str, Any]], bool]] = {
+    "no_fee": lambda p: p.get("library_type") in ("basic", "preferred"),
+    "basic": lambda p: p.get("library_type") == "basic",
+    "preferred": lambda p: p.get("preferred", False),
+    "extended": lambda p: p.get("library_type") == "extended",
+}
+
 class JLCPCBClient:
     """Async client for JLCPCB component search API with anti-detection via wafer."""
 
@@ -110,6 +178,13 @@ class JLCPCBClient:
         self._category_name_map: dict[str, int] = {}  # lowercase name -> category_id (O(1) lookup)
         self._subcategory_map: dict[int, tuple[int, dict[str, Any]]] = {}  # id -> (parent_id, subcategory)
         self._subcategory_name_map: dict[str, int] = {}  # name -> subcategory_id
+        # Name/singular/abbreviation -> category_id, used by match_category_by_name
+        self._category_name_index: dict[str, int] = {}
+        # Abbreviation -> category_id, resolved against the loaded categories
+        self._abbrev_to_id: dict[str, int] = {}
+        # When categories were last fetched from the API (None if set externally)
+        self._categories_fetched_at: float | None = None
+        self._category_refresh_task: asyncio.Task[None] | None = None
         # EasyEDA footprint cache: lcsc -> (timestamp, result_dict, is_error)
         self._easyeda_cache: dict[str, tuple[float, dict[str, Any], bool]] = {}
         # EasyEDA component cache: uuid -> (timestamp, result_dict, is_error)
@@ -120,8 +195,14 @@ class JLCPCBClient:
         self._easyeda_cache_lock: asyncio.Lock | None = None
         self._easyeda_component_cache_lock: asyncio.Lock | None = None
         self._part_cache_lock: asyncio.Lock | None = None
+        # In-flight EasyEDA footprint checks: lcsc -> future (dedupes concurrent callers)
+        self._easyeda_inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
         # Semaphore to limit concurrent EasyEDA requests (avoid rate limiting)
         self._easyeda_semaphore: asyncio.Semaphore | None = None
+        # In-flight JLCPCB API requests: request key -> future (dedupes concurrent callers)
+        self._request_inflight: dict[tuple[Any, ...], asyncio.Future[dict[str, Any]]] = {}
+        # Recent JLCPCB API responses: request key -> (timestamp, data), oldest first
+        self._recent_responses: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
         # Semaphore to limit concurrent JLCPCB requests (prevents IP blocking at scale)
         self._jlcpcb_semaphore: asyncio.Semaphore | None = None
 
@@ -147,20 +228,34 @@ class JLCPCBClient:
         """Set pre-loaded categories to avoid redundant API calls.
 
         Call this after fetch_categories() to share the cache.
+        Externally set categories are never refreshed in the background.
         """
+        self._rebuild_indexes(categories)
+        self._categories_fetched_at = None
+
+    def _rebuild_indexes(self, categories: list[dict[str, Any]]) -> None:
+        """Replace the category cache and rebuild every lookup map in one pass."""
         self._categories = categories
         self._category_map.clear()
         self._category_name_map.clear()
         self._subcategory_map.clear()
         self._subcategory_name_map.clear()
 
+        # Bound-method aliases keep attribute lookups out of the loop
+        set_category = self._category_map.__setitem__
+        set_subcategory = self._subcategory_map.__setitem__
+        set_subcategory_name = self._subcategory_name_map.__setitem__
+        build_name_mappings = self._build_category_name_mappings
         for cat in categories:
-            self._category_map[cat["id"]] = cat
-            self._build_category_name_mappings(cat)
-            for sub in cat.get("subcategories", []):
-                self._subcategory_map[sub["id"]] = (cat["id"], sub)
+            cat_id = cat["id"]
+            set_category(cat_id, cat)
+            build_name_mappings(cat)
+            for sub in cat.get("subcategories") or ():
+                sub_id = sub["id"]
+                set_subcategory(sub_id, (cat_id, sub))
                 # Store lowercase for case-insensitive matching
-                self._subcategory_name_map[sub["name"].lower()] = sub["id"]
+                set_subcategory_name(sub["name"].lower(), sub_id)
+        self._build_category_name_index()
 
     def _build_category_name_mappings(self, cat: dict[str, Any]) -> None:
         """Build O(1) name lookup mappings for a category.
@@ -220,25 +315,75 @@ class JLCPCBClient:
         return self._easyeda_session
 
     async def close(self):
-        """Release persistent HTTP sessions."""
+        """Release persistent HTTP sessions and stop any background category refresh."""
+        if self._category_refresh_task is not None:
+            self._category_refresh_task.cancel()
+            self._category_refresh_task = None
         self._jlcpcb_session = None
         self._easyeda_session = None
 
     async def _ensure_categories(self) -> None:
-        """Ensure categories are loaded (lazy initialization)."""
+        """Ensure categories are loaded (lazy initialization).
+
+        Once loaded, stale API-fetched categories are still served immediately
+        while a background task refreshes them (stale-while-revalidate).
+        """
         if self._categories:
+            self._schedule_category_refresh()
             return
 
-        self._categories = await self.fetch_categories()
+        self._rebuild_indexes(await self.fetch_categories())
+        self._categories_fetched_at = time.time()
 
-        # Build lookup maps
+    def _schedule_category_refresh(self) -> None:
+        """Start a background category refresh if API-fetched categories are stale."""
+        if (
+            self._categories_fetched_at is None
+            or self._category_refresh_task is not None
+            or time.time() - self._categories_fetched_at < CATEGORY_REFRESH_INTERVAL
+        ):
+            return
+        self._category_refresh_task = asyncio.create_task(self._refresh_categories())
+
+    async def _refresh_categories(self) -> None:
+        """Refetch categories and swap the lookup maps; keep stale data on failure."""
+        try:
+            categories = await self.fetch_categories()
+            if categories:
+                self.set_categories(categories)  # Synchronous rebuild: swap is atomic
+            self._categories_fetched_at = time.time()
+        except Exception as e:
+            logger.warning(f"Category refresh failed, keeping cached categories: {type(e).__name__}: {e}")
+            # Retry on a later call instead of immediately
+            self._categories_fetched_at = time.time() - CATEGORY_REFRESH_INTERVAL + 300
+        finally:
+            self._category_refresh_task = None
+
+    def _build_category_name_index(self) -> None:
+        """Precompute every match_category_by_name lookup into one dict.
+
+        Precedence (later entries override earlier ones):
+        1. Prefixes of 4+ chars of category names (first category wins)
+        2. Abbreviations resolved against the loaded categories
+        3. Exact names and simple singular forms
+        """
+        index: dict[str, int] = {}
         for cat in self._categories:
-            self._category_map[cat["id"]] = cat
-            self._build_category_name_mappings(cat)
-            for sub in cat.get("subcategories", []):
-                self._subcategory_map[sub["id"]] = (cat["id"], sub)
-                # Store lowercase for case-insensitive matching
-                self._subcategory_name_map[sub["name"].lower()] = sub["id"]
+            name_lower = cat["name"].lower()
+            for end in range(4, len(name_lower) + 1):
+                index.setdefault(name_lower[:end], cat["id"])
+        # Resolve each abbreviation's category name substring once per load
+        abbrev_to_id: dict[str, int] = {}
+        for abbrev, category_name in self._ABBREVIATION_TO_CATEGORY.items():
+            category_name_lower = category_name.lower()
+            for cat in self._categories:
+                if category_name_lower in cat["name"].lower():
+                    abbrev_to_id[abbrev] = cat["id"]
+                    break
+        self._abbrev_to_id = abbrev_to_id
+        index.update(abbrev_to_id)
+        index.update(self._category_name_map)
+        self._category_name_index = index
 
     def _get_category(self, category_id: int) -> dict[str, Any] | None:
         """Get category by ID from cache."""
@@ -279,47 +424,16 @@ class JLCPCBClient:
     }
 
     def _resolve_manufacturer(self, name: str) -> str:
-        """Resolve manufacturer alias to full name.
-
-        Lookup order:
-        1. Check aliases exactly (case-insensitive)
-        2. Check exact manufacturer names (case-insensitive)
-        3. Check aliases with normalized punctuation
-        4. Check manufacturer names with normalized punctuation
-        5. Return original name unchanged
-        """
-        name_lower = name.lower()
-        # Check aliases first (abbreviations and alternate names)
-        if name_lower in MANUFACTURER_ALIASES:
-            return MANUFACTURER_ALIASES[name_lower]
-        # Check if it matches a known manufacturer name (case-insensitive)
-        if name_lower in _MANUFACTURER_EXACT_NAMES:
-            return _MANUFACTURER_EXACT_NAMES[name_lower]
-        # Try normalized matching (ignore punctuation like . , - & etc)
-        name_normalized = _normalize_manufacturer_name(name)
-        if name_normalized in _MANUFACTURER_ALIASES_NORMALIZED:
-            return _MANUFACTURER_ALIASES_NORMALIZED[name_normalized]
-        if name_normalized in _MANUFACTURER_EXACT_NORMALIZED:
-            return _MANUFACTURER_EXACT_NORMALIZED[name_normalized]
-        # Return original unchanged
-        return name
+        """Resolve manufacturer alias to full name (memoized, see _resolve_manufacturer_name)."""
+        return _resolve_manufacturer_name(name)
 
     def _resolve_manufacturers(self, names: list[str]) -> list[str]:
         """Resolve a list of manufacturer names/aliases."""
-        return [self._resolve_manufacturer(name) for name in names]
+        return list(map(_resolve_manufacturer_name, names))
 
     def _resolve_abbreviation(self, abbrev: str) -> int | None:
-        """Resolve an abbreviation to a category ID using the live category cache."""
-        category_name = self._ABBREVIATION_TO_CATEGORY.get(abbrev)
-        if not category_name:
-            return None
-
-        # Find category by name (case-insensitive, partial match)
-        category_name_lower = category_name.lower()
-        for cat in self._categories:
-            if category_name_lower in cat["name"].lower():
-                return cat["id"]
-        return None
+        """Resolve an abbreviation to a category ID (precomputed when categories load)."""
+        return self._abbrev_to_id.get(abbrev)
 
     def match_category_by_name(self, query: str) -> int | None:
         """Match a query string against category names.
@@ -335,25 +449,60 @@ class JLCPCBClient:
 
         query_lower = query.lower().strip()
 
-        # O(1) lookup for exact match or singular form
-        if query_lower in self._category_name_map:
-            return self._category_name_map[query_lower]
-
-        # Check explicit abbreviation mappings (resolved dynamically)
-        abbrev_match = self._resolve_abbreviation(query_lower)
-        if abbrev_match is not None:
-            return abbrev_match
-
-        # Fallback: prefix matching for partial names (e.g., "resistor" matches "resistors")
-        for cat in self._categories:
-            cat_name = cat["name"].lower()
-            if cat_name.startswith(query_lower) and len(query_lower) >= 4:
-                return cat["id"]
-
-        return None
+        # O(1) lookup for exact match, singular form, abbreviation, or partial name
+        # prefix (e.g., "resistor" matches "resistors"); see _build_category_name_index
+        return self._category_name_index.get(query_lower)
 
     async def _request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
-        """Execute request to JLCPCB API.
+        """Execute request to JLCPCB API, deduplicating identical requests.
+
+        Identical requests (same URL and params) made concurrently share one
+        HTTP call, and a response is reused for JLCPCB_RESPONSE_CACHE_TTL seconds.
+        The returned data may be shared between callers and must not be mutated.
+        """
+        key = (url, tuple(sorted(
+            (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+        )))
+
+        recent = self._recent_responses.get(key)
+        if recent is not None:
+            if time.time() - recent[0] < JLCPCB_RESPONSE_CACHE_TTL:
+                return recent[1]
+            del self._recent_responses[key]
+
+        inflight = self._request_inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This caller was cancelled
+                # The owning request was cancelled - issue our own
+                return await self._request(url, params)
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved so an error with no waiters isn't logged twice
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._request_inflight[key] = future
+        try:
+            data = await self._send_request(url, params)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._request_inflight.pop(key, None)
+
+        future.set_result(data)
+        self._recent_responses[key] = (time.time(), data)
+        while len(self._recent_responses) > JLCPCB_RESPONSE_CACHE_MAX_SIZE:
+            self._recent_responses.popitem(last=False)
+        return data
+
+    async def _send_request(self, url: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send a single request to the JLCPCB API (called by _request).
 
         Wafer handles TLS fingerprinting, header rotation, rate limiting,
         retries, and 403 recovery automatically.
@@ -375,13 +524,7 @@ class JLCPCBClient:
                 response = await session.post(
                     url,
                     json=params,
-                    headers={
-                        "Origin": "https://jlcpcb.com",
-                        "Referer": "https://jlcpcb.com/parts",
-                        "Sec-Fetch-Site": "same-origin",
-                        "Sec-Fetch-Mode": "cors",
-                        "Sec-Fetch-Dest": "empty",
-                    },
+                    headers=_JLCPCB_REQUEST_HEADERS,
                 )
             except ChallengeDetected as e:
                 logger.warning(f"JLCPCB WAF challenge ({e.challenge_type}): {log_keyword}")
@@ -398,13 +541,14 @@ class JLCPCBClient:
             except WaferTimeout:
                 logger.warning(f"JLCPCB request timeout: {log_keyword}")
                 raise ValueError("JLCPCB request timed out — try again later")
-            logger.debug(f"JLCPCB response: {response.status_code}")
-            try:
-                response.raise_for_status()
-            except WaferHTTPError as e:
-                logger.warning(f"JLCPCB HTTP {e.status_code}: {log_keyword}")
-                raise ValueError(f"JLCPCB returned HTTP {e.status_code} — try again later")
-            data = response.json()
+            status = response.status_code
+            logger.debug(f"JLCPCB response: {status}")
+            # Inspect the status once instead of raise_for_status() + catch
+            if not response.ok:
+                logger.warning(f"JLCPCB HTTP {status}: {log_keyword}")
+                raise ValueError(f"JLCPCB returned HTTP {status} — try again later")
+            # Decode straight from bytes (skips wafer's str decode + charset sniffing)
+            data = json.loads(response.content)
 
             # Check for API-level errors
             if data.get("code") != 200:
@@ -471,7 +615,7 @@ class JLCPCBClient:
         lcsc = lcsc.strip().upper()
 
         # Validate LCSC format (C followed by digits)
-        if not lcsc or not lcsc.startswith("C") or not lcsc[1:].isdigit():
+        if not LCSC_PATTERN.fullmatch(lcsc):
             return {
                 "has_easyeda_footprint": None,
                 "easyeda_symbol_uuid": None,
@@ -481,12 +625,36 @@ class JLCPCBClient:
         # Check cache first (with TTL awareness for errors vs successes)
         now = time.time()
         async with self._get_easyeda_cache_lock():
-            if lcsc in self._easyeda_cache:
-                timestamp, result, is_error = self._easyeda_cache[lcsc]
+            entry = self._easyeda_cache.get(lcsc)
+            if entry is not None:
+                timestamp, result, is_error = entry
                 ttl = EASYEDA_ERROR_CACHE_TTL if is_error else EASYEDA_CACHE_TTL
                 if now - timestamp < ttl:
                     return result
 
+        # Coalesce concurrent checks for the same part into one HTTP request
+        inflight = self._easyeda_inflight.get(lcsc)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._easyeda_inflight[lcsc] = future
+        try:
+            result = await self._fetch_easyeda_footprint(lcsc)
+            future.set_result(result)
+            return result
+        finally:
+            self._easyeda_inflight.pop(lcsc, None)
+            if not future.done():
+                # Owner was cancelled - release waiters with the unknown result
+                future.set_result({
+                    "has_easyeda_footprint": None,
+                    "easyeda_symbol_uuid": None,
+                    "easyeda_footprint_uuid": None,
+                })
+
+    async def _fetch_easyeda_footprint(self, lcsc: str) -> dict[str, Any]:
+        """Fetch footprint availability from EasyEDA and cache it (called by check_easyeda_footprint)."""
         # Default result for errors/timeouts
         unknown_result: dict[str, Any] = {
             "has_easyeda_footprint": None,
@@ -514,7 +682,7 @@ class JLCPCBClient:
                     return result
 
                 response.raise_for_status()
-                data = response.json()
+                data = json.loads(response.content)
 
                 # Check response structure
                 if data.get("success") is True:
@@ -543,6 +711,19 @@ class JLCPCBClient:
                 await self._cache_easyeda_result(lcsc, unknown_result, True)
                 return unknown_result
 
+    async def _check_easyeda_footprints(self, codes: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Check EasyEDA footprints for many parts concurrently.
+
+        Duplicate codes are checked once; concurrency is bounded by the
+        EasyEDA semaphore inside check_easyeda_footprint().
+
+        Returns:
+            Dict mapping LCSC code -> check_easyeda_footprint() result
+        """
+        unique = list(dict.fromkeys(codes))
+        results = await asyncio.gather(*(self.check_easyeda_footprint(code) for code in unique))
+        return dict(zip(unique, results))
+
     def _cleanup_easyeda_component_cache_unlocked(self) -> None:
         """Clean up expired entries if cache is too large. Must hold lock."""
         if len(self._easyeda_component_cache) > EASYEDA_CACHE_MAX_SIZE:
@@ -612,8 +793,9 @@ class JLCPCBClient:
         # Check cache first
         now = time.time()
         async with self._get_easyeda_component_cache_lock():
-            if uuid in self._easyeda_component_cache:
-                timestamp, cached_result, is_error = self._easyeda_component_cache[uuid]
+            entry = self._easyeda_component_cache.get(uuid)
+            if entry is not None:
+                timestamp, cached_result, is_error = entry
                 ttl = EASYEDA_ERROR_CACHE_TTL if is_error else EASYEDA_CACHE_TTL
                 if now - timestamp < ttl:
                     if is_error:
@@ -628,7 +810,7 @@ class JLCPCBClient:
 
                 response = await session.get(url)
                 response.raise_for_status()
-                data = response.json()
+                data = json.loads(response.content)
 
                 # Check response structure
                 if not data.get("success"):
@@ -716,16 +898,8 @@ class JLCPCBClient:
             params["startStockNumber"] = min_stock
 
         # Library type filtering
-        if library_type:
-            if library_type == "basic":
-                params["componentLibraryType"] = "base"
-            elif library_type == "extended":
-                params["componentLibraryType"] = "expand"
-            elif library_type == "preferred":
-                params["preferredComponentFlag"] = True
-            elif library_type == "no_fee":
-                # Handled in search() with two parallel API calls (basic + preferred)
-                pass
+        if library_type in _LIBRARY_TYPE_PARAMS:
+            params.update(_LIBRARY_TYPE_PARAMS[library_type])
 
         # Package filtering (single or multi-select)
         if packages:
@@ -754,20 +928,14 @@ class JLCPCBClient:
         # preferredComponentFlag=True — they have no assembly fee (same as basic)
         lib_type = item.get("componentLibraryType", "")
         is_preferred = item.get("preferredComponentFlag", False)
-        if is_preferred:
-            library_type = "preferred"
-        elif lib_type == "base":
-            library_type = "basic"
-        elif lib_type == "expand":
-            library_type = "extended"
-        else:
-            library_type = lib_type
+        library_type = "preferred" if is_preferred else _LIB_TYPE_MAP.get(lib_type, lib_type)
 
         # Note: API returns firstSortName as subcategory, secondSortName as category
         stock = item.get("stockCount")
         package = item.get("componentSpecificationEn")
         subcategory = item.get("firstSortName")
         category = item.get("secondSortName")
+        attrs = item.get("attributes") or []  # Handle null/None
         # Get subcategory_id from API or lookup by name
         subcategory_id = item.get("firstSortId")
         if not subcategory_id and subcategory:
@@ -781,7 +949,7 @@ class JLCPCBClient:
             "price": round(price, 4) if price else None,
             "price_10": round(price_10, 4) if price_10 else None,
             "library_type": library_type,
-            "preferred": item.get("preferredComponentFlag", False),
+            "preferred": is_preferred,
             "category": category,
             "subcategory": subcategory,
             "subcategory_id": subcategory_id,
@@ -790,12 +958,13 @@ class JLCPCBClient:
 
         # Include key specs in slim mode
         # All attributes as a dict for compatibility checking and display
-        attrs = item.get("attributes") or []  # Handle null/None
-        result["specs"] = {
-            a.get("attribute_name_en"): a.get("attribute_value_name")
+        # (name, value) pairs are extracted once and shared with the full attributes list
+        attr_pairs = [
+            (name, a.get("attribute_value_name"))
             for a in attrs
-            if a.get("attribute_name_en")
-        }
+            if (name := a.get("attribute_name_en"))
+        ]
+        result["specs"] = dict(attr_pairs)
 
         if not slim:
             # Full details
@@ -818,12 +987,8 @@ class JLCPCBClient:
             # Full attributes list (beyond specs)
             if attrs:
                 result["attributes"] = [
-                    {
-                        "name": a.get("attribute_name_en"),
-                        "value": a.get("attribute_value_name"),
-                    }
-                    for a in attrs
-                    if a.get("attribute_name_en")
+                    {"name": name, "value": value}
+                    for name, value in attr_pairs
                 ]
 
         return result
@@ -844,10 +1009,69 @@ class JLCPCBClient:
         limit: int = DEFAULT_PAGE_SIZE,
     ) -> dict[str, Any]:
         """Search for components."""
-        # Load categories if filtering by category/subcategory, or if we have a query
-        # that might match a category name
+        results, total = await self._search_items(
+            query=query, category_id=category_id, subcategory_id=subcategory_id,
+            min_stock=min_stock, library_type=library_type, package=package,
+            manufacturer=manufacturer, packages=packages, manufacturers=manufacturers,
+            sort_by=sort_by, page=page, limit=limit,
+        )
+
+        # Calculate total pages
+        total_pages = (total + limit - 1) // limit if limit > 0 else 0
+
+        return {
+            "results": results,
+            "page": page,
+            "per_page": limit,
+            "total": total,
+            "total_pages": total_pages,
+            "has_more": page * limit < total,
+        }
+
+    async def _search_items(
+        self,
+        query: str | None = None,
+        category_id: int | None = None,
+        subcategory_id: int | None = None,
+        min_stock: int = DEFAULT_MIN_STOCK,
+        library_type: str | None = None,
+        package: str | None = None,
+        manufacturer: str | None = None,
+        packages: list[str] | None = None,
+        manufacturers: list[str] | None = None,
+        sort_by: Literal["quantity", "price"] | None = None,
+        page: int = 1,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Run a search and return (transformed results, total count) without the page envelope."""
+        # Load categories if filtering by category/subcategory (IDs are validated and
+        # sent with their names), or if we have a query that might match a category name
         if category_id or subcategory_id or query:
-            await self._ensure_categories()
+            if self._categories:
+                self._schedule_category_refresh()  # No await on the warm path
+            elif query and not category_id and not subcategory_id and library_type != "no_fee":
+                # Cold start: overlap the category fetch with a speculative keyword
+                # search. If the query doesn't match a category, the identical request
+                # below joins this in-flight call (see _request) instead of re-sending.
+                speculative = asyncio.create_task(self._request(
+                    JLCPCB_SEARCH_URL,
+                    self._build_search_params(
+                        query=query, min_stock=min_stock, library_type=library_type,
+                        package=package, manufacturer=manufacturer, packages=packages,
+                        manufacturers=manufacturers, sort_by=sort_by, page=page, limit=limit,
+                    ),
+                ))
+                # Errors surface through the joined request; don't log them twice
+                speculative.add_done_callback(lambda t: t.cancelled() or t.exception())
+                try:
+                    await self._ensure_categories()
+                except BaseException:
+                    speculative.cancel()
+                    raise
+                if self.match_category_by_name(query):
+                    speculative.cancel()  # Keyword results unused; category filter wins
+            else:
+                await self._ensure_categories()
 
         # Auto-match query to category if no category specified
         # e.g., "capacitor" -> category_id=2 (Capacitors)
@@ -898,7 +1122,6 @@ class JLCPCBClient:
                     pi += 1
 
             total = (basic_info.get("total") or 0) + (pref_info.get("total") or 0)
-            results = [self._transform_part(item, slim=True) for item in items]
         else:
             # Standard single-call path
             params = self._build_search_params(
@@ -915,19 +1138,8 @@ class JLCPCBClient:
             items = page_info.get("list") or []
             total = page_info.get("total") or 0
 
-            results = [self._transform_part(item, slim=True) for item in items]
-
-        # Calculate total pages
-        total_pages = (total + limit - 1) // limit if limit > 0 else 0
-
-        return {
-            "results": results,
-            "page": page,
-            "per_page": limit,
-            "total": total,
-            "total_pages": total_pages,
-            "has_more": page * limit < total,
-        }
+        results = [self._transform_part(item, slim=True) for item in items]
+        return results, total
 
     async def get_part(self, lcsc: str) -> dict[str, Any] | None:
         """Get full details for a specific part, including EasyEDA footprint availability.
@@ -939,16 +1151,17 @@ class JLCPCBClient:
         lcsc = lcsc.strip().upper()
 
         # Validate LCSC code format (C followed by digits)
-        if not lcsc or not lcsc.startswith("C") or not lcsc[1:].isdigit():
+        if not LCSC_PATTERN.fullmatch(lcsc):
             return None
 
-        # Check cache first
-        now = time.time()
-        async with self._get_part_cache_lock():
-            if lcsc in self._part_cache:
-                timestamp, cached_result = self._part_cache[lcsc]
-                if now - timestamp < PART_CACHE_TTL:
-                    return cached_result
+        # Check cache first. Reads are lock-free: writers mutate the dict without
+        # awaiting, so a single .get() never observes a partial update. Only
+        # _cache_part_result takes the lock.
+        entry = self._part_cache.get(lcsc)
+        if entry is not None:
+            timestamp, cached_result = entry
+            if time.time() - timestamp < PART_CACHE_TTL:
+                return cached_result
 
         # Search for the exact part code
         params = {
@@ -963,20 +1176,24 @@ class JLCPCBClient:
         component_info = data.get("componentPageInfo") or {}
         items = component_info.get("list") or []
 
-        # Find exact match
-        for item in items:
-            if item.get("componentCode") == lcsc:
-                result = self._transform_part(item, slim=False)
-                # Add EasyEDA footprint availability
-                easyeda_info = await self.check_easyeda_footprint(lcsc)
-                result.update(easyeda_info)
-                # Cache the result
-                await self._cache_part_result(lcsc, result)
-                return result
+        # Find exact match (usually the first item, scan the rest otherwise)
+        if items and items[0].get("componentCode") == lcsc:
+            item = items[0]
+        else:
+            item = next((it for it in items if it.get("componentCode") == lcsc), None)
+
+        if item is None:
+            # Cache negative result (part not found)
+            await self._cache_part_result(lcsc, None)
+            return None
 
-        # Cache negative result (part not found)
-        await self._cache_part_result(lcsc, None)
-        return None
+        result = self._transform_part(item, slim=False)
+        # Add EasyEDA footprint availability
+        easyeda_info = await self.check_easyeda_footprint(lcsc)
+        result.update(easyeda_info)
+        # Cache the result
+        await self._cache_part_result(lcsc, result)
+        return result
 
     async def find_alternatives(
         self,
@@ -1013,8 +1230,9 @@ class JLCPCBClient:
         effective_limit = max(1, min(limit, MAX_ALTERNATIVES))
         effective_min_stock = max(0, min_stock)
 
-        # Ensure categories are loaded for subcategory lookup
-        await self._ensure_categories()
+        # Reject malformed codes before loading categories or calling the API
+        if not LCSC_PATTERN.fullmatch(lcsc.strip().upper()):
+            return {"error": f"Part {lcsc.strip().upper()} not found"}
 
         # Get the original part details (includes EasyEDA info)
         original = await self.get_part(lcsc)
@@ -1038,9 +1256,11 @@ class JLCPCBClient:
         if primary_attr:
             primary_value = original.get("specs", {}).get(primary_attr)
 
-        # Find subcategory ID using O(1) lookup
-        subcategory_id = None
-        if subcategory_name:
+        # Subcategory ID comes with the part (firstSortId); fall back to an O(1)
+        # name lookup, which is the only path that needs categories loaded
+        subcategory_id = original.get("subcategory_id")
+        if not subcategory_id and subcategory_name:
+            await self._ensure_categories()
             subcategory_id = self.get_subcategory_id_by_name(subcategory_name)
 
         # Build search params - fetch extra for filtering
@@ -1076,23 +1296,28 @@ class JLCPCBClient:
         # Note: We don't pass package to search anymore - we do fuzzy post-filtering
         # This allows matching variants like CASE-B-3528-21(mm) vs CASE-B-3528-19(mm)
 
-        result = await self.search(**search_params)
+        search_results, _ = await self._search_items(**search_params)
 
-        # Filter out the original part
+        # Single pass over the search results: drop the original part, then apply
+        # the same-package (fuzzy) and library_type filters. library_type is
+        # applied before spec verification so discarded parts never reach spec parsing.
         original_lcsc = original.get("lcsc", "").upper()
+        orig_pkg_normalized = (
+            _normalize_package_for_matching(original["package"])
+            if same_package and original.get("package")
+            else None
+        )
+        predicate = _LIBRARY_TYPE_PREDICATES.get(library_type) if library_type else None
         candidates = [
-            p for p in result.get("results", [])
-            if p.get("lcsc", "").upper() != original_lcsc
+            p for p in search_results
+            if (p.get("lcsc") or "").upper() != original_lcsc
+            and (
+                orig_pkg_normalized is None
+                or _normalize_package_for_matching(p.get("package", "")) == orig_pkg_normalized
+            )
+            and (predicate is None or predicate(p))
         ]
 
-        # Filter by same package if requested (using fuzzy matching)
-        if same_package and original.get("package"):
-            orig_pkg_normalized = _normalize_package_for_matching(original["package"])
-            candidates = [
-                p for p in candidates
-                if _normalize_package_for_matching(p.get("package", "")) == orig_pkg_normalized
-            ]
-
         # For SUPPORTED categories: verify primary spec matches and compatibility
         # For UNSUPPORTED categories: skip verification, just return similar_parts
         compatible: list[dict[str, Any]] = []
@@ -1100,10 +1325,11 @@ class JLCPCBClient:
 
         if is_supported:
             # Verify primary spec matches (JLCPCB search may return fuzzy matches)
-            verified = [
+            # (generator: consumed once by the compatibility loop below)
+            verified = (
                 p for p in candidates
                 if not primary_attr or verify_primary_spec_match(original, p, primary_attr)
-            ]
+            )
             # Then check full compatibility
             for p in verified:
                 is_compat, verify_info = is_compatible_alternative(original, p, subcategory_name or "")
@@ -1123,11 +1349,9 @@ class JLCPCBClient:
             # Only check top candidates to avoid excessive API calls
             max_easyeda_checks = effective_limit * 2
             candidates_to_check = compatible[:max_easyeda_checks]
-            candidate_codes = [p.get("lcsc", "") for p in candidates_to_check if p.get("lcsc")]
-            easyeda_results = await asyncio.gather(
-                *[self.check_easyeda_footprint(code) for code in candidate_codes]
+            easyeda_map = await self._check_easyeda_footprints(
+                code for p in candidates_to_check if (code := p.get("lcsc"))
             )
-            easyeda_map = dict(zip(candidate_codes, easyeda_results))
 
             filtered_compatible = []
             for part in candidates_to_check:
@@ -1143,27 +1367,27 @@ class JLCPCBClient:
                     filtered_compatible.append(part)
             compatible = filtered_compatible
 
-        # Filter by library_type if specified (after compatibility check)
-        if library_type and library_type != "all":
-            if library_type == "no_fee":
-                compatible = [p for p in compatible if p.get("library_type") in ("basic", "preferred")]
-            elif library_type == "basic":
-                compatible = [p for p in compatible if p.get("library_type") == "basic"]
-            elif library_type == "preferred":
-                compatible = [p for p in compatible if p.get("preferred", False)]
-            elif library_type == "extended":
-                compatible = [p for p in compatible if p.get("library_type") == "extended"]
-
         # Score and rank alternatives
         min_price = min((p.get("price") for p in compatible if p.get("price")), default=None)
-        scored: list[tuple[int, dict[str, Any], dict[str, int], dict[str, Any]]] = []
-        for part in compatible:
+        # Bounded min-heap keeps only the top-k while scoring. Entries are keyed on
+        # (score, -index) so ties keep the earlier (higher stock) candidate and
+        # the part dicts are never compared.
+        heap: list[tuple[int, int, dict[str, Any], dict[str, int]]] = []
+        for i, part in enumerate(compatible):
             score, breakdown = score_alternative(part, original, min_price)
-            verify_info = verification_info_map.get(part.get("lcsc", ""), {"specs_verified": [], "specs_unparseable": []})
-            scored.append((score, part, breakdown, verify_info))
-
-        # Use heapq for efficient top-k selection instead of full sort
-        top_scored = heapq.nlargest(effective_limit, scored, key=lambda x: x[0])
+            entry = (score, -i, part, breakdown)
+            if len(heap) < effective_limit:
+                heapq.heappush(heap, entry)
+            elif (score, -i) > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+        top_scored: list[tuple[int, dict[str, Any], dict[str, int], dict[str, Any]]] = [
+            (
+                score, part, breakdown,
+                verification_info_map.get(part.get("lcsc", ""), {"specs_verified": [], "specs_unparseable": []}),
+            )
+            for score, _, part, breakdown in sorted(heap, key=lambda x: x[:2], reverse=True)
+        ]
 
         # Build response (different structure for supported vs unsupported)
         if is_supported:
@@ -1199,21 +1423,19 @@ class JLCPCBClient:
         if not sort_list:
             return []
 
-        categories = []
-        for cat in sort_list:
-            subcategories = []
-            for sub in cat.get("childSortList") or []:
-                subcategories.append({
-                    "id": sub.get("componentSortKeyId"),
-                    "name": sub.get("sortName"),
-                    "count": sub.get("componentCount", 0),
-                })
-
-            categories.append({
+        return [
+            {
                 "id": cat.get("componentSortKeyId"),
                 "name": cat.get("sortName"),
                 "count": cat.get("componentCount", 0),
-                "subcategories": subcategories,
-            })
-
-        return categories
+                "subcategories": [
+                    {
+                        "id": sub.get("componentSortKeyId"),
+                        "name": sub.get("sortName"),
+                        "count": sub.get("componentCount", 0),
+                    }
+                    for sub in cat.get("childSortList") or ()
+                ],
+            }
+            for cat in sort_list
+        ]
@@ -31,6 +31,9 @@ MAX_PAGE_SIZE = 100
 DEFAULT_MIN_STOCK = 10
 MAX_ALTERNATIVES = 50
 
+# Category refresh (only for categories fetched from the JLCPCB API, not set_categories)
+CATEGORY_REFRESH_INTERVAL = 86400  # Serve stale categories, refresh in background after 24 hours
+
 # Part cache settings (JLCPCB API)
 PART_CACHE_TTL = 3600  # Cache part details for 1 hour
 PART_CACHE_MAX_SIZE = 5000  # Max cached parts
@@ -39,6 +42,8 @@ PART_CACHE_MAX_SIZE = 5000  # Max cached parts
 JLCPCB_RATE_LIMIT = 0.2  # Min seconds between requests
 JLCPCB_RATE_JITTER = 0.1  # Random jitter added to rate limit
 JLCPCB_MAX_ROTATIONS = 10  # Max fingerprint rotations on 403
+JLCPCB_RESPONSE_CACHE_TTL = 5.0  # Serve identical API requests from memory for a few seconds
+JLCPCB_RESPONSE_CACHE_MAX_SIZE = 256  # Max recent responses kept for the short-lived cache
 
 # Mouser API
 MOUSER_API_KEY = os.getenv("MOUSER_API_KEY", "")
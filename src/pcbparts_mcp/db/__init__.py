@@ -16,7 +16,8 @@ from typing import Any, Literal
 
 from ..config import DEFAULT_MIN_STOCK
 from ..search import SearchEngine, SpecFilter, expand_package, resolve_manufacturer, row_to_dict, get_attribute_names
-from .connection import build_database, load_caches
+from ..search.query_builder import LIBRARY_TYPE_ORDER_CASE, LIBRARY_TYPE_ORDER_COLUMN
+from .connection import build_database, load_caches, upgrade_schema
 from .lookup import get_by_lcsc, get_by_lcsc_batch, get_by_mpn
 from .categories import (
     get_subcategory_name,
@@ -61,9 +62,10 @@ class ComponentDatabase:
         self._category_name_to_id: dict[str, int] = {}  # lowercase name -> id
         self._category_to_subcategories: dict[int, list[int]] = {}  # category_id -> [subcategory_ids]
         self._search_engine: SearchEngine | None = None
+        self._library_type_order = LIBRARY_TYPE_ORDER_COLUMN
 
     def _ensure_db(self) -> None:
-        """Ensure database exists, build if missing. Thread-safe."""
+        """Ensure database exists and is current, build if missing. Thread-safe."""
         if self._conn is not None:
             return
 
@@ -78,8 +80,20 @@ class ComponentDatabase:
                 logger.info(f"Database not found at {self.db_path}, building...")
                 build_database(self.data_dir, self.db_path)
 
-            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # sqlite3 reuses prepared statements keyed by SQL text. Each search issues
+            # a page query plus a count query whose shape varies with the filters
+            # used, so keep more of them than the default 128
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
             self._conn.row_factory = sqlite3.Row
+            # Read-heavy workload: serve pages via mmap, keep a larger page cache,
+            # and keep sort/temp b-trees in memory (WAL is already set by the builder)
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            self._conn.execute("PRAGMA cache_size=-65536")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            # Older read-only databases lack the indexed sort column: rank rows per query
+            self._library_type_order = (
+                LIBRARY_TYPE_ORDER_COLUMN if upgrade_schema(self._conn) else LIBRARY_TYPE_ORDER_CASE
+            )
 
             # Load caches
             (
@@ -98,6 +112,7 @@ class ComponentDatabase:
                 subcategory_name_to_id=self._subcategory_name_to_id,
                 category_name_to_id=self._category_name_to_id,
                 category_to_subcategories=self._category_to_subcategories,
+                library_type_order=self._library_type_order,
             )
 
     def close(self) -> None:
@@ -108,7 +123,7 @@ class ComponentDatabase:
                 self._conn = None
                 self._search_engine = None
 
-    def _get_attribute_names(self, name: str) -> list[str]:
+    def _get_attribute_names(self, name: str) -> tuple[str, ...]:
         """Get all possible attribute names for a given name (including aliases)."""
         return get_attribute_names(name)
 
@@ -285,6 +300,7 @@ class ComponentDatabase:
             library_type=library_type,
             prefer_no_fee=prefer_no_fee,
             limit=limit,
+            library_type_order=self._library_type_order,
         )
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict[str, Any]:
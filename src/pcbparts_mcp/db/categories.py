@@ -5,6 +5,7 @@ from typing import Any
 
 from ..config import DEFAULT_MIN_STOCK
 from ..alternatives import SPEC_PARSERS
+from ..search.query_builder import LIBRARY_TYPE_ORDER_COLUMN
 from ..search.result import row_to_dict
 from ..search.spec_filter import escape_like
 
@@ -108,6 +109,7 @@ def find_by_subcategory(
     library_type: str | None = None,
     prefer_no_fee: bool = True,
     limit: int = 100,
+    library_type_order: str = LIBRARY_TYPE_ORDER_COLUMN,
 ) -> list[dict[str, Any]]:
     """Find components in a subcategory, optionally matching a primary spec value.
 
@@ -123,6 +125,7 @@ def find_by_subcategory(
         library_type: Filter by library type - "basic", "preferred", or "extended"
         prefer_no_fee: Sort preference (default True)
         limit: Max results to return
+        library_type_order: SQL for the prefer_no_fee sort rank
 
     Returns:
         List of component dicts
@@ -159,8 +162,7 @@ def find_by_subcategory(
 
     # Sorting: prefer_no_fee sorts basic/preferred first
     if prefer_no_fee:
-        lib_type_order = "CASE library_type WHEN 'b' THEN 1 WHEN 'p' THEN 2 ELSE 3 END"
-        sql_parts.append(f"ORDER BY {lib_type_order}, stock DESC")
+        sql_parts.append(f"ORDER BY {library_type_order}, stock DESC")
     else:
         sql_parts.append("ORDER BY stock DESC")
     sql_parts.append("LIMIT ?")
@@ -169,29 +171,30 @@ def find_by_subcategory(
     sql = " ".join(sql_parts)
     cursor = conn.execute(sql, params)
 
+    # Parse the primary spec target once for the post-filter below
+    parser = SPEC_PARSERS.get(primary_spec) if primary_spec and primary_value else None
+    target = parser(str(primary_value)) if parser else None
+
+    # Stream rows: stop reading as soon as enough parts pass the post-filter
     results = []
-    for row in cursor.fetchall():
+    for row in cursor:
         part = row_to_dict(row, subcategories)
 
         # Post-filter for numeric primary spec
-        if primary_spec and primary_value:
-            parser = SPEC_PARSERS.get(primary_spec)
-            if parser:
-                target = parser(str(primary_value))
-                if target is not None:
-                    part_value = part.get("specs", {}).get(primary_spec)
-                    if part_value:
-                        parsed = parser(part_value)
-                        if parsed is None:
-                            continue
-                        # Allow 2% tolerance
-                        if target == 0:
-                            if parsed != 0:
-                                continue
-                        elif abs(parsed - target) / abs(target) > 0.02:
-                            continue
-                    else:
-                        continue  # No matching attribute
+        if target is not None:
+            part_value = part.get("specs", {}).get(primary_spec)
+            if part_value:
+                parsed = parser(part_value)
+                if parsed is None:
+                    continue
+                # Allow 2% tolerance
+                if target == 0:
+                    if parsed != 0:
+                        continue
+                elif abs(parsed - target) / abs(target) > 0.02:
+                    continue
+            else:
+                continue  # No matching attribute
 
         results.append(part)
         if len(results) >= limit:
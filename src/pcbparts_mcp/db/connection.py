@@ -2,6 +2,8 @@
 
 import logging
 import sqlite3
+import subprocess
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -11,11 +13,14 @@ logger = logging.getLogger(__name__)
 def build_database(data_dir: Path, db_path: Path) -> None:
     """Build the database from scraped data.
 
+    Runs scripts/build_database.py in a child interpreter so the memory used while
+    parsing every category file is returned to the OS when the build finishes,
+    instead of staying in the long-running server process.
+
     Args:
         data_dir: Directory containing component data files
         db_path: Output database path
     """
-    import importlib.util
     script_path = Path(__file__).parent.parent.parent.parent / "scripts" / "build_database.py"
 
     # Validate script path exists
@@ -25,32 +30,12 @@ def build_database(data_dir: Path, db_path: Path) -> None:
             f"The build_database.py script is required to create the component database."
         )
 
-    # Load the build script module
-    try:
-        spec = importlib.util.spec_from_file_location("build_database", script_path)
-        if spec is None or spec.loader is None:
-            raise ImportError(
-                f"Cannot create module spec for {script_path}\n"
-                f"The script may have syntax errors or missing dependencies."
-            )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-    except SyntaxError as e:
-        logger.error(f"Syntax error in build script: {e}")
-        raise ImportError(f"Syntax error in {script_path}: {e}") from e
-    except ImportError as e:
-        logger.error(f"Failed to load build script: {e}")
-        raise
-
-    # Execute the build function
     try:
-        if not hasattr(module, "build_database"):
-            raise AttributeError(
-                f"build_database function not found in {script_path}\n"
-                f"The script must define a build_database(data_dir, output, verbose) function."
-            )
-        module.build_database(data_dir, db_path, verbose=True)
-    except Exception as e:
+        subprocess.run(
+            [sys.executable, str(script_path), "--data-dir", str(data_dir), "--output", str(db_path)],
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
         logger.error(f"Database build failed: {e}")
         raise RuntimeError(
             f"Failed to build database from {data_dir}: {e}\n"
@@ -92,6 +77,47 @@ def build_history_database(data_dir: Path, db_path: Path) -> None:
         logger.warning(f"History database build failed (non-fatal): {e}")
 
 
+def upgrade_schema(conn: sqlite3.Connection) -> bool:
+    """Add schema objects that databases built by an older build script lack.
+
+    The database is only rebuilt when the file is missing, so an existing one can
+    predate columns the queries now rely on. Adding them in place takes seconds,
+    versus minutes for a full rebuild.
+
+    Args:
+        conn: SQLite connection to the component database
+
+    Returns:
+        Whether components has the library_type_order column (False when it is
+        missing and the database can't be written, e.g. a read-only mount)
+    """
+    columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(components)")}
+    if "library_type_order" in columns:
+        return True
+
+    logger.info("Adding library_type_order column and indexes to the component database")
+    try:
+        conn.execute("""
+            ALTER TABLE components ADD COLUMN library_type_order INTEGER GENERATED ALWAYS AS (
+                CASE library_type WHEN 'b' THEN 1 WHEN 'p' THEN 2 ELSE 3 END
+            ) VIRTUAL
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ltorder_stock ON components(library_type_order, stock DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_subcat_ltorder_stock "
+            "ON components(subcategory_id, library_type_order, stock DESC)"
+        )
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        logger.warning(f"Could not add library_type_order ({e}); sorting by a CASE expression instead")
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(components)")}
+        return "library_type_order" in columns
+    return True
+
+
 def load_caches(
     conn: sqlite3.Connection,
 ) -> tuple[
@@ -143,19 +143,19 @@ def get_by_lcsc_batch(
         )
 
     # Normalize codes (uppercase, dedupe while preserving order)
-    seen = set()
-    normalized = []
-    for code in lcsc_codes:
-        upper = code.upper()
-        if upper not in seen:
-            seen.add(upper)
-            normalized.append(upper)
-
-    # Single query with IN clause
-    placeholders = ",".join("?" * len(normalized))
+    normalized = list(dict.fromkeys(code.upper() for code in lcsc_codes))
+
+    # Single code: primary-key lookup
+    if len(normalized) == 1:
+        return {normalized[0]: get_by_lcsc(conn, normalized[0], subcategories)}
+
+    # Single query with IN clause. Pad the list to the next power of two with a
+    # code that never matches, so batch sizes share a handful of cached statements
+    padded_size = 1 << (len(normalized) - 1).bit_length()
+    placeholders = ",".join("?" * padded_size)
     cursor = conn.execute(
         f"SELECT * FROM components WHERE lcsc IN ({placeholders})",
-        normalized
+        normalized + [""] * (padded_size - len(normalized))
     )
 
     # Build result dict
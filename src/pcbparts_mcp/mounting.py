@@ -1,5 +1,7 @@
 """Mounting type detection for electronic component packages."""
 
+import functools
+
 # Categories that are NOT PCB-mountable components - return "not_applicable" for these
 NON_PCB_CATEGORIES = frozenset({
     "Building materials / Building hardware",
@@ -67,6 +69,7 @@ THROUGH_HOLE_PATTERNS = frozenset({
 })
 
 
+@functools.lru_cache(maxsize=8192)
 def detect_mounting_type(
     package: str | None,
     category: str | None = None,
@@ -89,6 +92,9 @@ def detect_mounting_type(
     Returns:
         "smd" for surface mount, "through_hole" for through-hole,
         "not_sure" if uncertain, "not_applicable" if not a PCB-mountable component.
+
+    Pure function of its inputs; memoized because search results repeat the
+    same (package, category, subcategory) combinations across rows.
     """
     # Check if this is a non-PCB category (heat sinks, cables, tools, etc.)
     if category and category in NON_PCB_CATEGORIES:
@@ -53,6 +53,8 @@ _TEMP_RANGE_PATTERN = re.compile(
 )
 _MEMORY_BIT_PATTERN = re.compile(r"([\d.]+)\s*([KMG])?BIT", re.IGNORECASE)
 _MEMORY_BYTE_PATTERN = re.compile(r"([\d.]+)\s*([KMG])?B", re.IGNORECASE)
+# Binary unit prefix -> multiplier (None: no prefix, plain bits/bytes)
+_MEMORY_UNIT_MULTIPLIERS: dict[str | None, int] = {None: 1, "K": 1024, "M": 1024**2, "G": 1024**3}
 _WAVELENGTH_PATTERN = re.compile(r"([\d.]+)\s*nm", re.IGNORECASE)
 _LUMINOSITY_PATTERN = re.compile(r"([\d.]+)\s*mcd", re.IGNORECASE)
 _CAPACITANCE_PF_PATTERN = re.compile(r"([\d.]+)\s*([pn])?", re.IGNORECASE)
@@ -310,28 +312,12 @@ def parse_memory_size(s: str) -> float | None:
     # Handle bits (Mbit, Kbit, Gbit)
     match = _MEMORY_BIT_PATTERN.search(s_upper)
     if match:
-        value = float(match.group(1))
-        suffix = match.group(2) or ""
-        if suffix == "K":
-            value *= 1024
-        elif suffix == "M":
-            value *= 1024 * 1024
-        elif suffix == "G":
-            value *= 1024 * 1024 * 1024
-        return value / 8  # Convert bits to bytes
+        return float(match.group(1)) * _MEMORY_UNIT_MULTIPLIERS[match.group(2)] / 8  # Bits to bytes
 
     # Handle bytes (KB, MB, GB)
     match = _MEMORY_BYTE_PATTERN.search(s_upper)
     if match:
-        value = float(match.group(1))
-        suffix = match.group(2) or ""
-        if suffix == "K":
-            value *= 1024
-        elif suffix == "M":
-            value *= 1024 * 1024
-        elif suffix == "G":
-            value *= 1024 * 1024 * 1024
-        return value
+        return float(match.group(1)) * _MEMORY_UNIT_MULTIPLIERS[match.group(2)]
 
     return None
 
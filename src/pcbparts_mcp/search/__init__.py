@@ -5,7 +5,7 @@ querying components with parametric filtering.
 """
 
 from .engine import SearchEngine
-from .spec_filter import SpecFilter, SPEC_TO_COLUMN, ATTRIBUTE_ALIASES, get_attribute_names, escape_like
+from .spec_filter import SpecFilter, SPEC_TO_COLUMN, ATTRIBUTE_ALIASES, get_attribute_names, get_spec_column, escape_like
 from .resolvers import (
     expand_query_synonyms,
     expand_package,
@@ -23,6 +23,7 @@ __all__ = [
     "SPEC_TO_COLUMN",
     "ATTRIBUTE_ALIASES",
     "get_attribute_names",
+    "get_spec_column",
     "escape_like",
     "expand_query_synonyms",
     "expand_package",
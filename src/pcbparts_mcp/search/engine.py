@@ -1,7 +1,8 @@
 """Search engine for parametric component search."""
 
 import sqlite3
-from typing import Any, Literal
+from collections import Counter
+from typing import Any, Callable, Literal
 
 from ..config import DEFAULT_MIN_STOCK
 from ..alternatives import SPEC_PARSERS
@@ -9,9 +10,9 @@ from ..subcategory_aliases import (
     resolve_subcategory_name as _resolve_subcategory_name,
     find_similar_subcategories as _find_similar_subcategories,
 )
-from .spec_filter import SpecFilter, get_attribute_names
+from .spec_filter import SpecFilter, get_attribute_names, get_spec_column
 from .resolvers import expand_query_synonyms, expand_package, resolve_manufacturer
-from .mpn import normalize_mpn, looks_like_mpn
+from .mpn import LCSC_PATTERN, normalize_mpn, looks_like_mpn
 from .query_builder import (
     build_fts_clause,
     build_subcategory_clause,
@@ -23,9 +24,47 @@ from .query_builder import (
     build_spec_filter_clauses,
     build_sort_clause,
     needs_numeric_post_filter,
+    LIBRARY_TYPE_ORDER_COLUMN,
 )
 from .result import row_to_dict
 
+# Single library type filters; the distribution counts drop these to report every type
+_SINGLE_LIBRARY_TYPE_CLAUSES = ("AND library_type = 'b'", "AND library_type = 'p'", "AND library_type = 'e'")
+
+_POST_FILTER_OPERATORS = frozenset((">=", "<=", ">", "<", "="))
+
+
+def _post_filter_predicate(
+    operator: str,
+    target_value: float,
+    attr_names: set[str],
+) -> Callable[[float], bool]:
+    """Build the numeric test a parsed part value must pass for one spec filter."""
+    if operator == "=":
+        # Frequency matching needs wider tolerance for RF components
+        # Common bands like "2.4GHz WiFi" spans 2.4-2.5GHz, and databases
+        # often store "2.45GHz" when users search "2.4GHz"
+        if any("frequency" in name.lower() for name in attr_names):
+            # Use 5% tolerance for frequency (allows 2.4GHz to match 2.45GHz)
+            eq_epsilon = abs(target_value) * 0.05 if target_value != 0 else 1e-9
+        else:
+            # Use 1% tolerance for other specs
+            eq_epsilon = abs(target_value) * 0.01 if target_value != 0 else 1e-9
+        return lambda value: abs(value - target_value) <= eq_epsilon
+
+    epsilon = abs(target_value) * 1e-9 if target_value != 0 else 1e-15
+    if operator == ">=":
+        low = target_value - epsilon
+        return lambda value: value >= low
+    if operator == "<=":
+        high = target_value + epsilon
+        return lambda value: value <= high
+    if operator == ">":
+        low = target_value + epsilon
+        return lambda value: value > low
+    high = target_value - epsilon
+    return lambda value: value < high
+
 
 class SearchEngine:
     """Search engine for parametric component queries.
@@ -42,6 +81,7 @@ class SearchEngine:
         subcategory_name_to_id: dict[str, int],
         category_name_to_id: dict[str, int],
         category_to_subcategories: dict[int, list[int]] | None = None,
+        library_type_order: str = LIBRARY_TYPE_ORDER_COLUMN,
     ):
         """Initialize the search engine.
 
@@ -52,13 +92,17 @@ class SearchEngine:
             subcategory_name_to_id: Lowercase name -> ID mapping
             category_name_to_id: Lowercase name -> ID mapping
             category_to_subcategories: Pre-built category_id -> [subcategory_ids] mapping
+            library_type_order: SQL for the prefer_no_fee sort rank
         """
         self._conn = conn
         self._subcategories = subcategories
         self._categories = categories
         self._subcategory_name_to_id = subcategory_name_to_id
         self._category_name_to_id = category_name_to_id
-        self._category_to_subcategories = category_to_subcategories or {}
+        self._category_to_subcategories = category_to_subcategories
+        self._library_type_order = library_type_order
+        # pre-computed column -> whether this database has any values in it
+        self._column_has_values: dict[str, bool] = {}
 
     def resolve_subcategory_name(self, name: str) -> int | None:
         """Resolve subcategory name to ID. Case-insensitive, supports partial match.
@@ -89,18 +133,13 @@ class SearchEngine:
         if name_lower in self._category_name_to_id:
             return self._category_name_to_id[name_lower]
 
-        # Collect all partial matches
-        matches: list[tuple[str, int]] = []
-        for cat_name_lower, cat_id in self._category_name_to_id.items():
-            if name_lower in cat_name_lower:
-                matches.append((cat_name_lower, cat_id))
-
-        if not matches:
-            return None
-
-        # Return shortest match (most specific)
-        matches.sort(key=lambda x: len(x[0]))
-        return matches[0][1]
+        # Shortest partial match (most specific), found in a single pass
+        best = min(
+            (item for item in self._category_name_to_id.items() if name_lower in item[0]),
+            key=lambda item: len(item[0]),
+            default=None,
+        )
+        return best[1] if best else None
 
     def _find_similar_subcategories(self, name: str, limit: int = 5) -> list[dict[str, Any]]:
         """Find subcategories similar to the given name (for error suggestions)."""
@@ -108,6 +147,30 @@ class SearchEngine:
             name, self._subcategory_name_to_id, self._subcategories, limit
         )
 
+    def _empty_spec_columns(self, spec_filters: list[SpecFilter]) -> frozenset[str]:
+        """Find the pre-computed columns these filters map to that hold no values.
+
+        A database built before a column (or one of its attribute spellings) was
+        added leaves it NULL everywhere; filtering on it would drop every part.
+        """
+        empty = set()
+        for spec_filter in spec_filters:
+            column_info = get_spec_column(spec_filter.name)
+            if column_info is None:
+                continue
+            column = column_info[0]
+            if column not in self._column_has_values:
+                try:
+                    row = self._conn.execute(
+                        f"SELECT 1 FROM components WHERE {column} IS NOT NULL LIMIT 1"
+                    ).fetchone()
+                except sqlite3.OperationalError:
+                    row = None  # Column missing from an older database
+                self._column_has_values[column] = row is not None
+            if not self._column_has_values[column]:
+                empty.add(column)
+        return frozenset(empty)
+
     def _execute_search(
         self,
         query: str | None,
@@ -150,19 +213,23 @@ class SearchEngine:
         Returns:
             Dict with results, total, library_type_counts, no_fee_available
         """
-        sql_parts = ["SELECT * FROM components WHERE 1=1"]
-        count_parts = ["SELECT COUNT(*) FROM components WHERE 1=1"]
+        # WHERE clauses shared by the page query and the library type count query.
+        # The library type clause is kept apart: the counts drop single-type filters.
+        where_parts: list[str] = []
         params: list[Any] = []
-        count_params: list[Any] = []
 
-        # FTS clause
-        if query:
+        # FTS clause (an existing LCSC code is matched on the primary key instead)
+        lcsc_code = query.strip().upper() if query else ""
+        if lcsc_code and LCSC_PATTERN.fullmatch(lcsc_code) and self._conn.execute(
+            "SELECT 1 FROM components WHERE lcsc = ?", [lcsc_code]
+        ).fetchone():
+            where_parts.append("AND lcsc = ?")
+            params.append(lcsc_code)
+        elif query:
             fts_sql, fts_params = build_fts_clause(query, match_all_terms)
             if fts_sql:
-                sql_parts.append(fts_sql)
-                count_parts.append(fts_sql)
+                where_parts.append(fts_sql)
                 params.extend(fts_params)
-                count_params.extend(fts_params)
 
         # Subcategory/category filter
         subcat_sql, subcat_params = build_subcategory_clause(
@@ -170,165 +237,132 @@ class SearchEngine:
             self._category_to_subcategories
         )
         if subcat_sql:
-            sql_parts.append(subcat_sql)
-            count_parts.append(subcat_sql)
+            where_parts.append(subcat_sql)
             params.extend(subcat_params)
-            count_params.extend(subcat_params)
 
         # Library type filter
         lib_type_sql = build_library_type_clause(library_type)
-        if lib_type_sql:
-            sql_parts.append(lib_type_sql)
-            count_parts.append(lib_type_sql)
 
         # Stock filter
         stock_sql, stock_params = build_stock_clause(min_stock)
         if stock_sql:
-            sql_parts.append(stock_sql)
-            count_parts.append(stock_sql)
+            where_parts.append(stock_sql)
             params.extend(stock_params)
-            count_params.extend(stock_params)
 
         # Package filter
         pkg_sql, pkg_params = build_package_clause(expanded_packages)
         if pkg_sql:
-            sql_parts.append(pkg_sql)
-            count_parts.append(pkg_sql)
+            where_parts.append(pkg_sql)
             params.extend(pkg_params)
-            count_params.extend(pkg_params)
 
         # Manufacturer filter
         if manufacturer:
             resolved_mfr = resolve_manufacturer(manufacturer)
             mfr_sql, mfr_params = build_manufacturer_clause(resolved_mfr)
-            sql_parts.append(mfr_sql)
-            count_parts.append(mfr_sql)
+            where_parts.append(mfr_sql)
             params.extend(mfr_params)
-            count_params.extend(mfr_params)
 
         # Mounting type filter
         if mounting_type:
             mount_sql, mount_params = build_mounting_type_clause(mounting_type)
             if mount_sql:
-                sql_parts.append(mount_sql)
-                count_parts.append(mount_sql)
+                where_parts.append(mount_sql)
                 params.extend(mount_params)
-                count_params.extend(mount_params)
 
         # Spec filters
         post_filter_metadata: list[tuple[SpecFilter, set[str], Any, float | None]] = []
+        empty_columns: frozenset[str] = frozenset()
         if spec_filters:
-            spec_sqls, spec_params_list, post_filter_metadata = build_spec_filter_clauses(spec_filters)
-            for spec_sql in spec_sqls:
-                sql_parts.append(spec_sql)
-                count_parts.append(spec_sql)
+            empty_columns = self._empty_spec_columns(spec_filters)
+            spec_sqls, spec_params_list, post_filter_metadata = build_spec_filter_clauses(
+                spec_filters, empty_columns
+            )
+            where_parts.extend(spec_sqls)
             params.extend(spec_params_list)
-            count_params.extend(spec_params_list)
 
         # Sorting
-        sort_clause = build_sort_clause(sort_by, prefer_no_fee, bool(query))
-        sql_parts.append(sort_clause)
+        sort_clause = build_sort_clause(sort_by, prefer_no_fee, bool(query), self._library_type_order)
 
         # Determine fetch limit (over-fetch if post-filtering needed)
         has_numeric_filters = spec_filters and any(
-            needs_numeric_post_filter(sf) for sf in spec_filters
+            needs_numeric_post_filter(sf, empty_columns) for sf in spec_filters
         )
         fetch_limit = limit * 10 if has_numeric_filters else limit
         fetch_limit = min(fetch_limit, 500)
 
-        # Pagination
-        sql_parts.append("LIMIT ? OFFSET ?")
-        params.extend([fetch_limit, offset])
-
         # Execute queries
-        sql = " ".join(sql_parts)
-        count_sql = " ".join(count_parts)
-
-        cursor = self._conn.execute(sql, params)
-        rows = cursor.fetchall()
-
-        # Combined count + library type distribution query
-        lib_count_sql = count_sql.replace("SELECT COUNT(*)", "SELECT library_type, COUNT(*)")
-        lib_count_sql_clean = lib_count_sql
-        for pattern in ["AND library_type = 'b'", "AND library_type = 'p'", "AND library_type = 'e'"]:
-            lib_count_sql_clean = lib_count_sql_clean.replace(pattern, "")
-        lib_count_sql_clean += " GROUP BY library_type"
-
-        lib_cursor = self._conn.execute(lib_count_sql_clean, count_params)
-        lib_type_map = {"b": "basic", "p": "preferred", "e": "extended"}
-        library_type_counts = {"basic": 0, "preferred": 0, "extended": 0}
-        total = 0
-        for row in lib_cursor:
-            lib_name = lib_type_map.get(row[0], row[0])
-            count = row[1]
-            if lib_name in library_type_counts:
-                library_type_counts[lib_name] = count
-            total += count
-
-        # Post-filter for numeric spec comparisons
+        where = " ".join(where_parts)
+        single_lib_type = lib_type_sql in _SINGLE_LIBRARY_TYPE_CLAUSES
+        count_where = where if single_lib_type else f"{where} {lib_type_sql}"
+        sql = f"SELECT * FROM components WHERE 1=1 {where} {lib_type_sql} {sort_clause} LIMIT ? OFFSET ?"
+
+        cursor = self._conn.execute(sql, [*params, fetch_limit, offset])
+
+        # Post-filter for numeric spec comparisons: one (attribute names, parser,
+        # predicate) entry per filter, with tolerances resolved outside the row loop
+        post_filters = [
+            (attr_names_set, parser, _post_filter_predicate(spec_filter.operator, target_value, attr_names_set))
+            for spec_filter, attr_names_set, parser, target_value in post_filter_metadata
+            if parser and target_value is not None and spec_filter.operator in _POST_FILTER_OPERATORS
+        ]
+
+        # Stream rows, stopping once the page is full; library types of the rows
+        # read are tallied in case the cursor turns out to hold every match
         results = []
-        for row in rows:
+        seen_lib_types: Counter[str] = Counter()
+        fetched = 0
+        page_full = False
+        for row in cursor:
+            fetched += 1
+            seen_lib_types[row["library_type"]] += 1
             part = row_to_dict(row, self._subcategories)
 
-            if post_filter_metadata:
-                passes = True
+            if post_filters:
                 part_specs = part.get("specs", {})
+                passes = True
 
-                for spec_filter, attr_names_set, parser, target_value in post_filter_metadata:
-                    if parser and spec_filter.operator in (">=", "<=", ">", "<", "="):
-                        if target_value is None:
-                            continue
-
-                        part_value = None
-                        for attr_name, attr_value in part_specs.items():
-                            if attr_name in attr_names_set:
-                                part_value = parser(attr_value)
-                                if part_value is not None:
-                                    break
-
-                        if part_value is None:
-                            passes = False
-                            break
-
-                        epsilon = abs(target_value) * 1e-9 if target_value != 0 else 1e-15
-
-                        # Frequency matching needs wider tolerance for RF components
-                        # Common bands like "2.4GHz WiFi" spans 2.4-2.5GHz, and databases
-                        # often store "2.45GHz" when users search "2.4GHz"
-                        is_frequency = any(
-                            "frequency" in name.lower()
-                            for name in attr_names_set
-                        )
-                        if is_frequency:
-                            # Use 5% tolerance for frequency (allows 2.4GHz to match 2.45GHz)
-                            eq_epsilon = abs(target_value) * 0.05 if target_value != 0 else 1e-9
-                        else:
-                            # Use 1% tolerance for other specs
-                            eq_epsilon = abs(target_value) * 0.01 if target_value != 0 else 1e-9
-
-                        if spec_filter.operator == "=" and abs(part_value - target_value) > eq_epsilon:
-                            passes = False
-                            break
-                        elif spec_filter.operator == ">=" and part_value < target_value - epsilon:
-                            passes = False
-                            break
-                        elif spec_filter.operator == "<=" and part_value > target_value + epsilon:
-                            passes = False
-                            break
-                        elif spec_filter.operator == ">" and part_value <= target_value + epsilon:
-                            passes = False
-                            break
-                        elif spec_filter.operator == "<" and part_value >= target_value - epsilon:
-                            passes = False
-                            break
+                for attr_names_set, parser, predicate in post_filters:
+                    part_value = None
+                    for attr_name, attr_value in part_specs.items():
+                        if attr_name in attr_names_set:
+                            part_value = parser(attr_value)
+                            if part_value is not None:
+                                break
+
+                    if part_value is None or not predicate(part_value):
+                        passes = False
+                        break
 
                 if not passes:
                     continue
 
             results.append(part)
             if len(results) >= limit:
+                page_full = True
                 break
 
+        if offset == 0 and not page_full and fetched < fetch_limit and not single_lib_type:
+            # A short first page already holds every SQL match, and the counts cover
+            # the same rows (only a single-type filter is dropped for them), so use
+            # the tally instead of running the count query
+            lib_rows = seen_lib_types.items()
+        else:
+            # Combined count + library type distribution query
+            lib_count_sql = (
+                f"SELECT library_type, COUNT(*) FROM components WHERE 1=1 {count_where} "
+                "GROUP BY library_type"
+            )
+            lib_rows = self._conn.execute(lib_count_sql, params)
+
+        lib_type_map = {"b": "basic", "p": "preferred", "e": "extended"}
+        library_type_counts = {"basic": 0, "preferred": 0, "extended": 0}
+        total = 0
+        for lib_code, count in lib_rows:
+            lib_name = lib_type_map.get(lib_code, lib_code)
+            if lib_name in library_type_counts:
+                library_type_counts[lib_name] = count
+            total += count
+
         no_fee_available = library_type_counts["basic"] > 0 or library_type_counts["preferred"] > 0
 
         return {
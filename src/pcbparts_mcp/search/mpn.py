@@ -8,6 +8,10 @@ is a fallback behavior, not input transformation.
 import re
 
 
+# LCSC part code format: "C" followed by ASCII digits (e.g., "C1525")
+LCSC_PATTERN = re.compile(r"C[0-9]+")
+
+
 # =============================================================================
 # MPN Suffix Handling
 # =============================================================================
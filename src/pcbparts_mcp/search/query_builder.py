@@ -1,5 +1,6 @@
 """SQL query building functions for component search."""
 
+import functools
 import re
 from typing import Any
 
@@ -10,52 +11,87 @@ from .spec_filter import (
     _escape_like,
     generate_value_patterns,
     get_attribute_names,
+    get_spec_column,
 )
 
 
-def build_fts_clause(query: str, match_all_terms: bool) -> tuple[str, list[str]]:
-    """Build FTS (full-text search) WHERE clause.
+# Pre-formatted numeric comparison clauses per pre-computed column and operator,
+# so column filters only bind parameters ("=" binds a +/-1% BETWEEN range)
+_COLUMN_SQL: dict[str, dict[str, str]] = {
+    column: {
+        "=": f"AND {column} BETWEEN ? AND ?",
+        ">=": f"AND {column} >= ?",
+        "<=": f"AND {column} <= ?",
+        ">": f"AND {column} > ?",
+        "<": f"AND {column} < ?",
+    }
+    for column, _ in SPEC_TO_COLUMN.values()
+}
+
+# Leading number of a value like "100Ohm" (matched against "100Ω@100MHz")
+_LEADING_NUMBER = re.compile(r'^(\d+(?:\.\d+)?)')
+
+
+def _string_value_pattern(name: str, value: str, substring: bool, impedance_at_freq: bool) -> str:
+    """Build the attributes LIKE pattern for a non-numeric "=" match on one attribute name."""
+    if substring:
+        return f'%"{_escape_like(name)}"%{_escape_like(value)}%'
+    if impedance_at_freq:
+        # Extract numeric part from value like "100Ohm" -> "100"
+        # to match database format "100Ω@100MHz"
+        numeric_match = _LEADING_NUMBER.match(value)
+        if numeric_match:
+            return f'%"{_escape_like(name)}", "{numeric_match.group(1)}%'
+        return f'%"{_escape_like(name)}", "{_escape_like(value)}%'
+    return f'%"{_escape_like(name)}", "{_escape_like(value)}"%'
+
+
+_FTS_SQL = """
+        AND lcsc IN (
+            SELECT lcsc FROM components_fts
+            WHERE components_fts MATCH ?
+        )
+    """
 
-    Args:
-        query: The search query string
-        match_all_terms: True for AND logic, False for OR logic
 
-    Returns:
-        Tuple of (sql_clause, params) or (None, []) if invalid query
+@functools.lru_cache(maxsize=1024)
+def _build_fts_query(query: str, match_all_terms: bool) -> str:
+    """Build the FTS5 MATCH expression for a query, or "" if it is not searchable.
+
+    Memoized: agents repeat the same query text while adjusting other filters.
     """
     # Validate query length
     if len(query) > 500:
-        return "", []
+        return ""
 
     # Validate for control characters
     if any(ord(c) < 32 and c not in '\t\n\r' for c in query) or '\x00' in query:
-        return "", []
+        return ""
 
     # Build FTS5 query: tokenize, quote each term, add prefix matching
-    tokens = query.split()
     fts_parts = []
-    for token in tokens:
-        if not token:
-            continue
+    for token in query.split():
         escaped = token.replace('"', '""')
         fts_parts.append(f'"{escaped}"*')
 
-    if not fts_parts:
-        return "", []
-
     # Join with space (AND) or OR based on match_all_terms
-    if match_all_terms:
-        fts_query = " ".join(fts_parts)
-    else:
-        fts_query = " OR ".join(fts_parts)
+    return (" " if match_all_terms else " OR ").join(fts_parts)
 
-    sql = """
-        AND lcsc IN (
-            SELECT lcsc FROM components_fts
-            WHERE components_fts MATCH ?
-        )
+
+def build_fts_clause(query: str, match_all_terms: bool) -> tuple[str, list[str]]:
+    """Build FTS (full-text search) WHERE clause.
+
+    Args:
+        query: The search query string
+        match_all_terms: True for AND logic, False for OR logic
+
+    Returns:
+        Tuple of (sql_clause, params) or ("", []) if invalid query
     """
-    return sql, [fts_query]
+    fts_query = _build_fts_query(query, match_all_terms)
+    if not fts_query:
+        return "", []
+    return _FTS_SQL, [fts_query]
 
 
 def build_subcategory_clause(
@@ -79,9 +115,10 @@ def build_subcategory_clause(
         return "AND subcategory_id = ?", [subcategory_id]
     elif category_id:
         # Get all subcategory IDs for this category
-        # Use pre-built mapping if available (O(1)), otherwise iterate (O(n))
-        if category_to_subcategories and category_id in category_to_subcategories:
-            subcat_ids = category_to_subcategories[category_id]
+        # Use pre-built mapping if available (O(1)), otherwise iterate (O(n)).
+        # A loaded mapping covers every category, so a miss means no subcategories.
+        if category_to_subcategories:
+            subcat_ids = category_to_subcategories.get(category_id, [])
         else:
             subcat_ids = [
                 sid for sid, info in subcategories.items()
@@ -308,11 +345,14 @@ def _group_multi_value_filters(spec_filters: list[SpecFilter]) -> list[SpecFilte
 
 def build_spec_filter_clauses(
     spec_filters: list[SpecFilter],
+    empty_columns: frozenset[str] = frozenset(),
 ) -> tuple[list[str], list[Any], list[tuple[SpecFilter, set[str], Any, float | None]]]:
     """Build spec filter clauses for SQL and collect post-filter metadata.
 
     Args:
         spec_filters: List of SpecFilter objects
+        empty_columns: Pre-computed columns holding no values in this database;
+            specs mapped to them use LIKE patterns plus post-filtering instead
 
     Returns:
         Tuple of:
@@ -341,19 +381,8 @@ def build_spec_filter_clauses(
             or_conditions = []
             for value in values:
                 for name in attr_names:
-                    if use_substring_match:
-                        pattern = f'%"{_escape_like(name)}"%{_escape_like(value)}%'
-                    elif is_impedance_at_freq:
-                        numeric_match = re.match(r'^(\d+(?:\.\d+)?)', value)
-                        if numeric_match:
-                            numeric_part = numeric_match.group(1)
-                            pattern = f'%"{_escape_like(name)}", "{numeric_part}%'
-                        else:
-                            pattern = f'%"{_escape_like(name)}", "{_escape_like(value)}%'
-                    else:
-                        pattern = f'%"{_escape_like(name)}", "{_escape_like(value)}"%'
                     or_conditions.append("attributes LIKE ? ESCAPE '\\'")
-                    params.append(pattern)
+                    params.append(_string_value_pattern(name, value, use_substring_match, is_impedance_at_freq))
 
             if or_conditions:
                 combined = " OR ".join(or_conditions)
@@ -367,42 +396,25 @@ def build_spec_filter_clauses(
         attr_names = get_attribute_names(spec_filter.name)
 
         # Check if we have a pre-computed column for this spec
-        column_info = None
-        for name in [spec_filter.name] + attr_names:
-            if name in SPEC_TO_COLUMN:
-                column_info = SPEC_TO_COLUMN[name]
-                break
-
-        if column_info and spec_filter.operator in (">=", "<=", ">", "<", "="):
+        column_info = get_spec_column(spec_filter.name)
+
+        if (
+            column_info
+            and column_info[0] not in empty_columns
+            and spec_filter.operator in (">=", "<=", ">", "<", "=")
+        ):
+            # Every column entry carries its parser: dispatch is one direct call
             column_name, parser = column_info
-            # Use the parser if available, otherwise try SPEC_PARSERS
-            if parser is None:
-                for name in attr_names:
-                    parser = SPEC_PARSERS.get(name)
-                    if parser:
-                        break
-
-            if parser:
-                parsed_value = parser(spec_filter.value)
-                if parsed_value is not None:
-                    # Use SQL numeric comparison on pre-computed column
-                    if spec_filter.operator == "=":
-                        tolerance = abs(parsed_value) * 0.01 if parsed_value != 0 else 1e-9
-                        sql_clauses.append(f"AND {column_name} BETWEEN ? AND ?")
-                        params.extend([parsed_value - tolerance, parsed_value + tolerance])
-                    elif spec_filter.operator == ">=":
-                        sql_clauses.append(f"AND {column_name} >= ?")
-                        params.append(parsed_value)
-                    elif spec_filter.operator == "<=":
-                        sql_clauses.append(f"AND {column_name} <= ?")
-                        params.append(parsed_value)
-                    elif spec_filter.operator == ">":
-                        sql_clauses.append(f"AND {column_name} > ?")
-                        params.append(parsed_value)
-                    elif spec_filter.operator == "<":
-                        sql_clauses.append(f"AND {column_name} < ?")
-                        params.append(parsed_value)
-                    continue
+            parsed_value = parser(spec_filter.value)
+            if parsed_value is not None:
+                # Use SQL numeric comparison on pre-computed column
+                sql_clauses.append(_COLUMN_SQL[column_name][spec_filter.operator])
+                if spec_filter.operator == "=":
+                    tolerance = abs(parsed_value) * 0.01 if parsed_value != 0 else 1e-9
+                    params.extend([parsed_value - tolerance, parsed_value + tolerance])
+                else:
+                    params.append(parsed_value)
+                continue
 
         # Fall back to LIKE patterns for specs without pre-computed columns
         parser = None
@@ -410,6 +422,9 @@ def build_spec_filter_clauses(
             parser = SPEC_PARSERS.get(name)
             if parser:
                 break
+        if parser is None and column_info:
+            # Same parser the build uses to fill the column
+            parser = column_info[1]
 
         parsed_value = None
         if parser:
@@ -439,9 +454,7 @@ def build_spec_filter_clauses(
                     sql_clauses.append(f"AND ({combined})")
 
             # Add to post-filter metadata (needs Python post-filtering)
-            attr_names_set = set(attr_names)
-            target_value = parser(spec_filter.value) if parser else None
-            post_filter_metadata.append((spec_filter, attr_names_set, parser, target_value))
+            post_filter_metadata.append((spec_filter, set(attr_names), parser, parsed_value))
 
         elif spec_filter.operator == "=":
             # String exact value match (non-numeric)
@@ -451,21 +464,10 @@ def build_spec_filter_clauses(
 
             or_conditions = []
             for name in attr_names:
-                if use_substring_match:
-                    pattern = f'%"{_escape_like(name)}"%{_escape_like(spec_filter.value)}%'
-                elif is_impedance_at_freq:
-                    # Extract numeric part from value like "100Ohm" -> "100"
-                    # to match database format "100Ω@100MHz"
-                    numeric_match = re.match(r'^(\d+(?:\.\d+)?)', spec_filter.value)
-                    if numeric_match:
-                        numeric_part = numeric_match.group(1)
-                        pattern = f'%"{_escape_like(name)}", "{numeric_part}%'
-                    else:
-                        pattern = f'%"{_escape_like(name)}", "{_escape_like(spec_filter.value)}%'
-                else:
-                    pattern = f'%"{_escape_like(name)}", "{_escape_like(spec_filter.value)}"%'
                 or_conditions.append("attributes LIKE ? ESCAPE '\\'")
-                params.append(pattern)
+                params.append(_string_value_pattern(
+                    name, spec_filter.value, use_substring_match, is_impedance_at_freq
+                ))
             if or_conditions:
                 combined = " OR ".join(or_conditions)
                 sql_clauses.append(f"AND ({combined})")
@@ -473,10 +475,17 @@ def build_spec_filter_clauses(
     return sql_clauses, params, post_filter_metadata
 
 
+# prefer_no_fee sort rank (b=1, p=2, e=3): the indexed generated column, or the
+# same expression computed per row for read-only databases built without it
+LIBRARY_TYPE_ORDER_COLUMN = "library_type_order"
+LIBRARY_TYPE_ORDER_CASE = "CASE library_type WHEN 'b' THEN 1 WHEN 'p' THEN 2 ELSE 3 END"
+
+
 def build_sort_clause(
     sort_by: str,
     prefer_no_fee: bool,
     has_query: bool,
+    lib_type_order: str = LIBRARY_TYPE_ORDER_COLUMN,
 ) -> str:
     """Build ORDER BY clause.
 
@@ -484,11 +493,11 @@ def build_sort_clause(
         sort_by: Sort mode - "stock", "price", or "relevance"
         prefer_no_fee: Whether to prioritize basic > preferred > extended
         has_query: Whether there's a text query (affects relevance sort)
+        lib_type_order: SQL for the library type rank (column or CASE expression)
 
     Returns:
         SQL ORDER BY clause
     """
-    lib_type_order = "CASE library_type WHEN 'b' THEN 1 WHEN 'p' THEN 2 ELSE 3 END"
 
     if sort_by == "price":
         if prefer_no_fee:
@@ -507,23 +516,28 @@ def build_sort_clause(
             return "ORDER BY stock DESC"
 
 
-def needs_numeric_post_filter(spec_filter: SpecFilter) -> bool:
+def needs_numeric_post_filter(
+    spec_filter: SpecFilter,
+    empty_columns: frozenset[str] = frozenset(),
+) -> bool:
     """Check if a spec filter needs Python post-filtering.
 
     Returns True if the filter cannot be fully handled by SQL
     and requires Python post-processing.
     """
-    attr_names = get_attribute_names(spec_filter.name)
-
     # Check if this spec has a pre-computed column
-    for name in [spec_filter.name] + attr_names:
-        if name in SPEC_TO_COLUMN:
-            return False  # SQL handles this with indexed column query
+    column_info = get_spec_column(spec_filter.name)
+    if column_info is not None and column_info[0] not in empty_columns:
+        return False  # SQL handles this with indexed column query
+
+    attr_names = get_attribute_names(spec_filter.name)
 
     # Check if we need post-filtering for numeric comparison
     if spec_filter.operator in (">=", "<=", ">", "<"):
         return True
     if spec_filter.operator == "=":
+        if column_info is not None:
+            return True
         for name in attr_names:
             if SPEC_PARSERS.get(name):
                 return True
@@ -1,5 +1,6 @@
 """Query synonym expansion, package resolution, and manufacturer resolution."""
 
+import functools
 import re
 
 from ..manufacturer_aliases import KNOWN_MANUFACTURERS, MANUFACTURER_ALIASES
@@ -10,33 +11,36 @@ from ..manufacturer_aliases import KNOWN_MANUFACTURERS, MANUFACTURER_ALIASES
 # =============================================================================
 # Query synonyms - expand search terms to include equivalent names
 # When any term in a group is searched, all terms in that group are searched
-# Format: (primary_term, [patterns]) where patterns are pre-compiled regexes
-# for all terms that should map to the primary term
-_SYNONYM_GROUPS: list[tuple[str, list[re.Pattern[str]]]] = [
+# Format: (primary_term, terms) - every lowercase literal term maps to the primary term
+_SYNONYM_TERMS: list[tuple[str, tuple[str, ...]]] = [
     # Miniature coaxial connectors - all names for the same connector family
     # IPEX gives the most search results, so we map all variants to it
-    ("IPEX", [
-        re.compile(r"u\.fl", re.IGNORECASE),
-        re.compile(r"mhf", re.IGNORECASE),
-        re.compile(r"i-pex", re.IGNORECASE),
-        re.compile(r"hirose u\.fl", re.IGNORECASE),
-        re.compile(r"ipx", re.IGNORECASE),
-    ]),
+    # ("hirose u.fl" needs no entry: its "u.fl" part is rewritten, keeping "hirose")
+    ("IPEX", ("u.fl", "mhf", "i-pex", "ipx")),
+]
+
+# (primary_term, terms, pattern): pattern is one pre-compiled alternation of the
+# group's terms; the plain terms drive a substring check that skips the regex
+_SYNONYM_GROUPS: list[tuple[str, tuple[str, ...], re.Pattern[str]]] = [
+    (primary, terms, re.compile("|".join(map(re.escape, terms)), re.IGNORECASE))
+    for primary, terms in _SYNONYM_TERMS
 ]
 
 
+@functools.lru_cache(maxsize=1024)
 def expand_query_synonyms(query: str) -> str:
     """Expand query with synonyms for better search results.
 
     For example, searching "U.FL" will also search for "IPEX" since they're
     the same connector type with different trade names.
     """
-    for primary_term, patterns in _SYNONYM_GROUPS:
-        for pattern in patterns:
-            if pattern.search(query):
-                # Found a match - replace with primary term
-                query = pattern.sub(primary_term, query)
-                break  # Only replace first match per group
+    query_lower = query.lower()
+    for primary_term, terms, pattern in _SYNONYM_GROUPS:
+        # Most queries contain no synonym at all; a substring scan rules that out
+        if any(term in query_lower for term in terms):
+            # One scan per group: every synonym of the group is replaced in a single pass
+            query = pattern.sub(primary_term, query)
+            query_lower = query.lower()
 
     return query
 
@@ -119,12 +123,19 @@ SMD_PACKAGE_FAMILIES: dict[str, list[str]] = {
 # Regex to detect bare 4-digit dimensions (e.g., "3215", "5032")
 _BARE_DIMENSION_RE = re.compile(r"^\d{4}$")
 
+# Explicit SMD prefix with optional pin suffix: "SMD3215", "smd-3215", "smd3215-2p"
+_SMD_PREFIX_RE = re.compile(r"^smd-?(\d{4,5})(?:-\d+p)?$")
+
 # Build case-insensitive lookup for known manufacturers
 _MANUFACTURER_LOWER_TO_EXACT: dict[str, str] = {
     name.lower(): name for name in KNOWN_MANUFACTURERS
 }
 
+# Single lowercase lookup: aliases (already lowercase keys) override exact names
+_MANUFACTURER_LOOKUP: dict[str, str] = {**_MANUFACTURER_LOWER_TO_EXACT, **MANUFACTURER_ALIASES}
+
 
+@functools.lru_cache(maxsize=1024)
 def expand_package(package: str) -> list[str]:
     """Expand package name to include family variants.
 
@@ -134,6 +145,8 @@ def expand_package(package: str) -> list[str]:
         "3215" -> ["SMD3215", "SMD3215-2P", "SMD3215-4P", "SMD3215-8P"]
         "SMD3215" -> ["SMD3215", "SMD3215-2P", "SMD3215-4P", "SMD3215-8P"]
         "QFN-24-EP(4x4)" -> ["QFN-24-EP(4x4)"]  # Specific, no expansion
+
+    Results are cached and shared between callers; treat them as read-only.
     """
     pkg_lower = package.lower()
 
@@ -148,7 +161,7 @@ def expand_package(package: str) -> list[str]:
             return SMD_PACKAGE_FAMILIES[package]
 
     # Check for explicit SMD prefix: "SMD3215" or "smd-3215" -> expand to variants
-    smd_match = re.match(r"^smd-?(\d{4,5})(?:-\d+p)?$", pkg_lower)
+    smd_match = _SMD_PREFIX_RE.match(pkg_lower)
     if smd_match:
         dim = smd_match.group(1)
         if dim in SMD_PACKAGE_FAMILIES:
@@ -166,15 +179,6 @@ def resolve_manufacturer(name: str) -> str:
         "texas instruments" -> "Texas Instruments"
         "YAGEO" -> "YAGEO" (already canonical)
     """
-    name_lower = name.lower()
-
-    # Check aliases first (e.g., "ti" -> "Texas Instruments")
-    if name_lower in MANUFACTURER_ALIASES:
-        return MANUFACTURER_ALIASES[name_lower]
-
-    # Check case-insensitive match against known manufacturers
-    if name_lower in _MANUFACTURER_LOWER_TO_EXACT:
-        return _MANUFACTURER_LOWER_TO_EXACT[name_lower]
-
-    # Return as-is (will use case-insensitive SQL match)
-    return name
+    # Aliases first (e.g., "ti" -> "Texas Instruments"), then case-insensitive
+    # known names; otherwise return as-is (will use case-insensitive SQL match)
+    return _MANUFACTURER_LOOKUP.get(name.lower(), name)
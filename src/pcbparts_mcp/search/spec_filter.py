@@ -1,6 +1,10 @@
 """Spec filter definitions and attribute mappings for parametric search."""
 
+import functools
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Literal
 
 from ..parsers import (
@@ -13,6 +17,11 @@ from ..parsers import (
     parse_power,
     parse_frequency,
     parse_ppm,
+    parse_memory_size,
+    parse_integer,
+    parse_decibels,
+    parse_wavelength,
+    parse_capacitance_pf,
 )
 
 
@@ -24,8 +33,14 @@ from ..parsers import (
 # LIKE patterns on JSON, which is much faster and uses indexes.
 #
 # Format: spec_name -> (column_name, parser_function)
+# Spelling variants that differ only in case, spacing or punctuation
+# ("Rds(on)" vs "RDS(on)") need no entry; lookups go through _SPEC_TO_COLUMN_CANON.
+#
+# Only list a spec once its column is known to be filled for the attribute
+# spellings the parts actually use (tests/test_db.py checks the coverage): a
+# column left NULL by the build silently drops those parts from the results.
 
-SPEC_TO_COLUMN: dict[str, tuple[str, Any]] = {
+_SPEC_TO_COLUMN: dict[str, tuple[str, Any]] = {
     # Passives - Resistance
     "Resistance": ("resistance_ohms", parse_resistance),
 
@@ -37,8 +52,8 @@ SPEC_TO_COLUMN: dict[str, tuple[str, Any]] = {
     "DC Resistance(DCR)": ("dcr_ohms", parse_resistance),
     "DCR": ("dcr_ohms", parse_resistance),
     "Current - Saturation(Isat)": ("isat_a", parse_current),
-    "Current - Saturation (Isat)": ("isat_a", parse_current),
     "Isat": ("isat_a", parse_current),
+    "Saturation Current": ("isat_a", parse_current),
 
     # Voltage
     "Voltage Rating": ("voltage_max_v", parse_voltage),
@@ -61,7 +76,8 @@ SPEC_TO_COLUMN: dict[str, tuple[str, Any]] = {
     "Current - Continuous Drain(Id)": ("id_max_a", parse_current),
     "Id": ("id_max_a", parse_current),
     "RDS(on)": ("rds_on_ohms", parse_resistance),
-    "Rds(on)": ("rds_on_ohms", parse_resistance),
+    "Input Capacitance(Ciss)": ("ciss_pf", parse_capacitance_pf),
+    "Ciss": ("ciss_pf", parse_capacitance_pf),
 
     # Diodes
     "Voltage - DC Reverse(Vr)": ("vr_max_v", parse_voltage),
@@ -89,39 +105,75 @@ SPEC_TO_COLUMN: dict[str, tuple[str, Any]] = {
 
     # Op-Amps
     "Gain Bandwidth Product": ("gbw_hz", parse_frequency),
+    "Slew Rate": ("slew_rate_vus", parse_voltage),  # V/µs
 
     # Capacitors
     "Ripple Current": ("ripple_current_a", parse_current),
     "Equivalent Series Resistance(ESR)": ("esr_ohms", parse_resistance),
     "ESR": ("esr_ohms", parse_resistance),
+    "Lifetime": ("lifetime_hours", parse_integer),
+
+    # RF
+    "Noise Figure": ("noise_figure_db", parse_decibels),
 
     # MCU
-    "Flash": ("flash_size_bytes", None),  # Special: memory size parser
-    "Program Memory Size": ("flash_size_bytes", None),
-    "SRAM": ("ram_size_bytes", None),
-    "RAM Size": ("ram_size_bytes", None),
+    "Flash": ("flash_size_bytes", parse_memory_size),
+    "Program Memory Size": ("flash_size_bytes", parse_memory_size),
+    "Program Storage Size": ("flash_size_bytes", parse_memory_size),
+    "SRAM": ("ram_size_bytes", parse_memory_size),
+    "RAM Size": ("ram_size_bytes", parse_memory_size),
     "Speed": ("clock_speed_hz", parse_frequency),
     "CPU Maximum Speed": ("clock_speed_hz", parse_frequency),
 
-    # Memory ICs
-    "Capacity": ("memory_capacity_bits", None),
-    "Memory Size": ("memory_capacity_bits", None),
+    # Memory ICs (stored in bytes by build_database, like the MCU memory columns)
+    "Capacity": ("memory_capacity_bits", parse_memory_size),
+    "Memory Size": ("memory_capacity_bits", parse_memory_size),
 
     # Battery Chargers
     "Charging Current": ("charge_current_a", parse_current),
     "Charge Current - Max": ("charge_current_a", parse_current),
+    "Charge Current": ("charge_current_a", parse_current),
+    "Fast Charge Current": ("charge_current_a", parse_current),
 
     # TVS / ESD
     "Clamping Voltage": ("clamping_voltage_v", parse_voltage),
+    "Clamping Voltage@Ipp": ("clamping_voltage_v", parse_voltage),
     "Reverse Stand-Off Voltage (Vrwm)": ("standoff_voltage_v", parse_voltage),
     "Peak Pulse Power(Ppk)": ("surge_power_w", parse_power),
+
+    # LEDs
+    "Dominant Wavelength": ("wavelength_nm", parse_wavelength),
+    "Wavelength - Dominant": ("wavelength_nm", parse_wavelength),
+}
+# Intern keys (many contain spaces/parentheses, so they aren't auto-interned);
+# SpecFilter interns names too, so lookups hit the identity fast path.
+# Aliases share one (column, parser) tuple per column instead of a copy each.
+# Exposed read-only: the table is fixed at import.
+_unique_columns: dict[tuple[str, Any], tuple[str, Any]] = {}
+SPEC_TO_COLUMN: Mapping[str, tuple[str, Any]] = MappingProxyType(
+    {sys.intern(k): _unique_columns.setdefault(v, v) for k, v in _SPEC_TO_COLUMN.items()}
+)
+
+# Characters ignored when comparing spec names
+_SPEC_NAME_STRIP = str.maketrans("", "", "()[]- _")
+
+
+@functools.lru_cache(maxsize=256)
+def _canon(name: str) -> str:
+    """Canonical spec name: lowercase with whitespace and punctuation removed."""
+    return name.translate(_SPEC_NAME_STRIP).lower()
+
+
+# Canonical spec name -> (column_name, parser_function)
+_SPEC_TO_COLUMN_CANON: dict[str, tuple[str, Any]] = {
+    _canon(k): v for k, v in SPEC_TO_COLUMN.items()
 }
 
 
 _VALID_OPERATORS = frozenset({"=", ">=", "<=", ">", "<"})
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecFilter:
     """Filter for a component specification/attribute.
 
@@ -136,12 +188,14 @@ class SpecFilter:
     value: str
 
     def __post_init__(self) -> None:
-        """Validate operator is one of the allowed values."""
+        """Validate operator is one of the allowed values and intern the name."""
         if self.operator not in _VALID_OPERATORS:
             raise ValueError(
                 f"Invalid operator '{self.operator}'. "
                 f"Must be one of: {', '.join(sorted(_VALID_OPERATORS))}"
             )
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
 
     def to_dict(self) -> dict[str, str]:
         return {"name": self.name, "op": self.operator, "value": self.value}
@@ -193,13 +247,17 @@ for _alias, _full_names in ATTRIBUTE_ALIASES.items():
         _ATTR_FULL_TO_ALIASES[_full_name].append(_alias)
 
 
+# Single-pass escape table for LIKE wildcards (backslash is the escape character)
+_LIKE_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
 def escape_like(value: str) -> str:
     """Escape SQL LIKE wildcards (%, _) in user input.
 
     Uses backslash as the escape character, which must be specified
     in the LIKE clause with ESCAPE '\\'.
     """
-    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return value.translate(_LIKE_ESCAPE_TABLE)
 
 
 # Keep private alias for backward compatibility within this module
@@ -280,27 +338,61 @@ def generate_value_patterns(spec_name: str, value: str, parsed_value: float | No
     return patterns[:3]  # Limit to 3 patterns max
 
 
-def get_attribute_names(name: str) -> list[str]:
+# name -> every attribute name to try, for aliases, full names and parser-known names.
+# Built on first use because SPEC_PARSERS lives in alternatives, which imports this module.
+_ATTR_RESOLVE: dict[str, tuple[str, ...]] | None = None
+
+
+def _build_attr_resolve() -> dict[str, tuple[str, ...]]:
+    from ..alternatives import SPEC_PARSERS
+
+    # Later sources win, mirroring the old lookup order: alias > parser name > full name
+    table: dict[str, tuple[str, ...]] = {}
+    for full_name, aliases in _ATTR_FULL_TO_ALIASES.items():
+        table[full_name] = tuple(ATTRIBUTE_ALIASES[aliases[0]])
+    for parser_name in SPEC_PARSERS:
+        table[parser_name] = (parser_name,)
+    for alias, full_names in ATTRIBUTE_ALIASES.items():
+        table[alias] = tuple(full_names)
+    return table
+
+
+def get_attribute_names(name: str) -> tuple[str, ...]:
     """Get all possible attribute names for a given name (including aliases).
 
     Args:
         name: The attribute name or alias to look up
 
     Returns:
-        List of possible attribute names
+        Tuple of possible attribute names (the name itself if it is unknown)
     """
-    from ..alternatives import SPEC_PARSERS
+    global _ATTR_RESOLVE
+    table = _ATTR_RESOLVE
+    if table is None:
+        # Built complete before it is published, so other threads never see it half-filled
+        table = _ATTR_RESOLVE = _build_attr_resolve()
+    return table.get(name) or (name,)
+
 
-    # Check if this is an alias (e.g., "Vds" -> ["Drain to Source Voltage"])
-    if name in ATTRIBUTE_ALIASES:
-        return ATTRIBUTE_ALIASES[name]
-    # Check if this is already a full attribute name (has parser)
-    if name in SPEC_PARSERS:
-        return [name]
-    # Check if this full name maps to any aliases using O(1) reverse lookup
-    if name in _ATTR_FULL_TO_ALIASES:
-        # Get all names in the alias group
-        first_alias = _ATTR_FULL_TO_ALIASES[name][0]
-        return ATTRIBUTE_ALIASES[first_alias]
-    # No alias found, return as-is
-    return [name]
+@functools.lru_cache(maxsize=512)
+def get_spec_column(name: str) -> tuple[str, Any] | None:
+    """Get the pre-computed (column_name, parser) for a spec name or any of its aliases.
+
+    Names are compared in canonical form (case, whitespace and punctuation
+    ignored). Resolves the name and its alias group once; repeated filter names
+    hit the cache instead of rebuilding the candidate list for each alias.
+
+    Args:
+        name: The spec filter name or alias (e.g., "Vds")
+
+    Returns:
+        (column_name, parser) tuple, or None if the spec has no dedicated column
+    """
+    column_info = _SPEC_TO_COLUMN_CANON.get(_canon(name))
+    if column_info is not None:
+        return column_info
+    for attr_name in get_attribute_names(name):
+        column_info = _SPEC_TO_COLUMN_CANON.get(_canon(attr_name))
+        if column_info is not None:
+            return column_info
+    return None
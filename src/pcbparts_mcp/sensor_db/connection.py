@@ -10,7 +10,7 @@ def build_sensor_database(data_dir: Path, db_path: Path) -> None:
     """Build the sensor database from scraped JSON data.
 
     Uses importlib to dynamically load scripts/build_sensor_db.py and call its
-    build() function. Same pattern as db/connection.py.
+    build() function.
 
     Args:
         data_dir: Directory containing sensors/ subdirectory with JSON files
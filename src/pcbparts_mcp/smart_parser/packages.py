@@ -64,6 +64,20 @@ PACKAGE_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (re.compile(r'\b(USB-?[ABC]|TYPE-?[ABC]|MICRO-?USB|MINI-?USB)\b', re.IGNORECASE), 'usb'),
 ]
 
+# All package patterns as one alternation: a single scan rules out queries with no
+# package. Priority order still decides the package, so hits re-run the list above.
+# (The case-sensitive patterns are digit-only, so IGNORECASE doesn't change them.)
+_ANY_PACKAGE_PATTERN = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern, _ in PACKAGE_PATTERNS), re.IGNORECASE
+)
+
+# Hyphen normalization for package names (SOT23 -> SOT-23, SOD123 -> SOD-123, TO92 -> TO-92)
+_PACKAGE_HYPHEN_NORMALIZATIONS = [
+    (re.compile(r'SOT(\d)'), r'SOT-\1'),
+    (re.compile(r'SOD(\d)'), r'SOD-\1'),
+    (re.compile(r'TO(\d)'), r'TO-\1'),
+]
+
 
 def extract_package(query: str) -> tuple[str | None, str, str | None]:
     """Extract package from query and return (package, remaining_query, suggested_subcategory).
@@ -76,14 +90,16 @@ def extract_package(query: str) -> tuple[str | None, str, str | None]:
     Returns:
         Tuple of (package, remaining_query, suggested_subcategory)
     """
+    if not _ANY_PACKAGE_PATTERN.search(query):
+        return None, query, None
+
     for pattern, pkg_type in PACKAGE_PATTERNS:
         match = pattern.search(query)
         if match:
             package = match.group(1).upper()
             # Normalize: remove optional hyphen variations
-            package = re.sub(r'SOT(\d)', r'SOT-\1', package)
-            package = re.sub(r'SOD(\d)', r'SOD-\1', package)
-            package = re.sub(r'TO(\d)', r'TO-\1', package)
+            for hyphen_pattern, replacement in _PACKAGE_HYPHEN_NORMALIZATIONS:
+                package = hyphen_pattern.sub(replacement, package)
             remaining = query[:match.start()] + query[match.end():]
             remaining = remaining.strip()
 
@@ -1,7 +1,8 @@
 """Main parser for smart natural language queries."""
 
+import functools
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from ..search.spec_filter import SpecFilter
@@ -14,7 +15,20 @@ from .mapping import map_value_to_spec, infer_subcategory_from_values
 from .connectors import extract_connector_series, ConnectorSpec
 
 
-@dataclass
+# Keyword patterns used by parse_smart_query, compiled once at import
+_WHITESPACE = re.compile(r'\s+')
+_STANDALONE_NUMBER = re.compile(r'\b(\d+)\b')
+_LEADED_MODIFIER = re.compile(r'\b(radial|through.?hole|pth|leaded)\b', re.IGNORECASE)
+_POTENTIOMETER_KEYWORD = re.compile(r'\b(trimmer|potentiometer|trimpot|variable\s*resistor)\b', re.IGNORECASE)
+_DUAL = re.compile(r'\bdual\b', re.IGNORECASE)
+_SINGLE_ROW = re.compile(r'\b(single|1)\s*row\b', re.IGNORECASE)
+_DOUBLE_ROW = re.compile(r'\b(double|dual|2)\s*row\b', re.IGNORECASE)
+_MAGNETICS = re.compile(r'\bmagnetics?\b', re.IGNORECASE)
+_SINGLE_LETTER = re.compile(r'\b[A-Za-z]\b')
+_ORPHANED_HYPHEN = re.compile(r'\s*-\s*')
+
+
+@dataclass(slots=True)
 class ParsedQuery:
     """Result of parsing a smart query string."""
     original: str
@@ -50,6 +64,14 @@ def parse_smart_query(query: str) -> ParsedQuery:
     Returns:
         ParsedQuery with structured filters
     """
+    parsed = _parse_smart_query(query)
+    # Cached results are shared: hand out fresh containers so callers can't alter them
+    return replace(parsed, spec_filters=list(parsed.spec_filters), detected=dict(parsed.detected))
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_smart_query(query: str) -> ParsedQuery:
+    """Parse a query (memoized; repeated queries skip all extraction passes)."""
     result = ParsedQuery(original=query, remaining_text=query)
     detected: dict[str, Any] = {}
     remaining = query
@@ -97,6 +119,9 @@ def parse_smart_query(query: str) -> ParsedQuery:
 
     # Step 3: Extract component type (subcategory)
     subcategory, remaining, matched_keyword = extract_component_type(remaining)
+    # Lowercase once; the keyword and step-3 subcategory are checked again in later steps
+    kw_lower = matched_keyword.lower() if matched_keyword else ""
+    subcategory_lower = subcategory.lower() if subcategory else ""
     if subcategory:
         result.subcategory = subcategory
         detected["component_type"] = matched_keyword
@@ -105,7 +130,6 @@ def parse_smart_query(query: str) -> ParsedQuery:
         # Special case: if keyword contains type info, add the Type filter
         # e.g., "n-channel mosfet" should add Type=N-Channel
         if matched_keyword:
-            kw_lower = matched_keyword.lower()
             if "n-channel" in kw_lower or kw_lower == "nmos":
                 result.spec_filters.append(SpecFilter("Type", "=", "N-Channel"))
                 detected.setdefault("semantic", []).append("n-channel (from keyword)")
@@ -120,15 +144,14 @@ def parse_smart_query(query: str) -> ParsedQuery:
                 detected.setdefault("semantic", []).append("pnp (from keyword)")
 
         # Special case: "radial" or "through hole" with electrolytic -> leaded capacitors
-        if subcategory.lower() == "aluminum electrolytic capacitors - smd":
-            remaining_lower = remaining.lower()
-            if re.search(r'\b(radial|through.?hole|pth|leaded)\b', remaining_lower):
+        if subcategory_lower == "aluminum electrolytic capacitors - smd":
+            if _LEADED_MODIFIER.search(remaining):
                 result.subcategory = "aluminum electrolytic capacitors - leaded"
                 detected["subcategory"] = result.subcategory
                 detected.setdefault("semantic", []).append("radial/through-hole (leaded)")
                 # Remove the modifier from remaining text
-                remaining = re.sub(r'\b(radial|through.?hole|pth|leaded)\b', '', remaining, flags=re.IGNORECASE).strip()
-                remaining = re.sub(r'\s+', ' ', remaining)
+                remaining = _LEADED_MODIFIER.sub('', remaining).strip()
+                remaining = _WHITESPACE.sub(' ', remaining)
     elif pkg_suggested_subcat:
         # Use package-suggested subcategory (e.g., USB-C -> USB connectors)
         result.subcategory = pkg_suggested_subcat
@@ -141,7 +164,8 @@ def parse_smart_query(query: str) -> ParsedQuery:
 
     # Step 4a-pre: Filter out dimension values for display components
     # Display resolutions like "128x64" look like dimensions but should not be treated as such
-    if result.subcategory and 'display' in result.subcategory.lower():
+    subcat_lower = (result.subcategory or "").lower()
+    if 'display' in subcat_lower:
         values = [v for v in values if v.unit_type != "dimensions"]
         if values:
             detected["values"] = [{"raw": v.raw, "type": v.unit_type, "normalized": v.normalized} for v in values]
@@ -150,10 +174,10 @@ def parse_smart_query(query: str) -> ParsedQuery:
     # This handles cases like "8 pin header" where "pin header" was extracted first,
     # leaving "8" alone which doesn't match the "N pin" pattern
     connector_words = ("header", "connector", "terminal", "socket", "plug", "receptacle")
-    is_connector = matched_keyword and any(word in matched_keyword.lower() for word in connector_words)
+    is_connector = matched_keyword and any(word in kw_lower for word in connector_words)
     if is_connector:
         # Look for standalone numbers in remaining text that could be pin counts
-        standalone_num_match = re.search(r'\b(\d+)\b', remaining)
+        standalone_num_match = _STANDALONE_NUMBER.search(remaining)
         if standalone_num_match:
             # Check if this number isn't already captured as a value
             num_val = int(standalone_num_match.group(1))
@@ -174,32 +198,32 @@ def parse_smart_query(query: str) -> ParsedQuery:
                     })
                     # Remove the number from remaining
                     remaining = remaining[:standalone_num_match.start()] + remaining[standalone_num_match.end():]
-                    remaining = re.sub(r'\s+', ' ', remaining).strip()
+                    remaining = _WHITESPACE.sub(' ', remaining).strip()
 
     # Step 4b: Infer subcategory from values if not already set
     if not result.subcategory and values:
         inferred = infer_subcategory_from_values(values)
         if inferred:
             result.subcategory = inferred
+            subcat_lower = inferred.lower()
             detected["subcategory_inferred"] = inferred
 
     # Step 4c: Override subcategory based on keywords in remaining text
     # This handles cases like "10K trimmer" where value was detected first
-    remaining_lower = remaining.lower()
-    if re.search(r'\b(trimmer|potentiometer|trimpot|variable\s*resistor)\b', remaining_lower):
+    if _POTENTIOMETER_KEYWORD.search(remaining):
         # Potentiometer/trimmer keywords should override chip resistor inference
-        if not result.subcategory or result.subcategory.lower() == "chip resistor - surface mount":
-            result.subcategory = "potentiometers, variable resistors"
+        if not result.subcategory or subcat_lower == "chip resistor - surface mount":
+            result.subcategory = subcat_lower = "potentiometers, variable resistors"
             detected["subcategory"] = result.subcategory
             detected.setdefault("semantic", []).append("potentiometer/trimmer (from keyword)")
             # Remove the keyword from remaining
-            remaining = re.sub(r'\b(trimmer|potentiometer|trimpot|variable\s*resistor)\b', '', remaining, flags=re.IGNORECASE).strip()
-            remaining = re.sub(r'\s+', ' ', remaining)
+            remaining = _POTENTIOMETER_KEYWORD.sub('', remaining).strip()
+            remaining = _WHITESPACE.sub(' ', remaining)
 
     # Step 4d: Handle standalone numbers as impedance for ferrite beads
     # "ferrite bead 0603 30" -> the "30" should be parsed as 30Ω impedance
-    if result.subcategory and result.subcategory.lower() == "ferrite beads":
-        standalone_num_match = re.search(r'\b(\d+)\b', remaining)
+    if subcat_lower == "ferrite beads":
+        standalone_num_match = _STANDALONE_NUMBER.search(remaining)
         if standalone_num_match:
             num_val = int(standalone_num_match.group(1))
             # Common ferrite bead impedance values: 10-2000Ω typically
@@ -221,7 +245,7 @@ def parse_smart_query(query: str) -> ParsedQuery:
                     detected.setdefault("semantic", []).append(f"impedance={num_val}Ω (from standalone number)")
                     # Remove the number from remaining
                     remaining = remaining[:standalone_num_match.start()] + remaining[standalone_num_match.end():]
-                    remaining = re.sub(r'\s+', ' ', remaining).strip()
+                    remaining = _WHITESPACE.sub(' ', remaining).strip()
 
     # Step 5: Extract semantic descriptors
     semantic_filters, remaining = extract_semantic_descriptors(remaining)
@@ -237,7 +261,6 @@ def parse_smart_query(query: str) -> ParsedQuery:
         "inductors (smd)", "power inductors", "inductors, coils, chokes",
         "led", "leds", "light emitting diodes",
     }
-    subcat_lower = (result.subcategory or "").lower()
 
     for value in values:
         # Special handling: dimensions become package filter for inductors/LEDs
@@ -253,7 +276,7 @@ def parse_smart_query(query: str) -> ParsedQuery:
         # Special handling: skip spec filters for connectors
         # Most connectors in the database have empty attributes dicts, so spec filters fail
         # Pin count, pitch, etc. should be used in FTS search instead
-        if result.subcategory and 'connector' in result.subcategory.lower():
+        if 'connector' in subcat_lower:
             continue  # Don't add spec filters for connectors
 
         spec_name, operator = map_value_to_spec(value, subcategory, matched_keyword)
@@ -266,8 +289,8 @@ def parse_smart_query(query: str) -> ParsedQuery:
     # Step 6b: Handle "dual" for MOSFETs
     # "dual" is too common a word to add to NOISE_WORDS, but in MOSFET context
     # it means Number="2 N-Channel" or "2 P-Channel"
-    if (result.subcategory and result.subcategory.lower() == "mosfets"
-            and re.search(r'\bdual\b', remaining, re.IGNORECASE)):
+    if (subcat_lower == "mosfets"
+            and _DUAL.search(remaining)):
         # Find which channel type was specified
         channel_type = None
         for sf in result.spec_filters:
@@ -281,16 +304,16 @@ def parse_smart_query(query: str) -> ParsedQuery:
             detected.setdefault("semantic", []).append(f"dual (-> Number=2 {channel_type})")
 
         # Remove "dual" from remaining text to prevent FTS failure
-        remaining = re.sub(r'\bdual\b', '', remaining, flags=re.IGNORECASE)
-        remaining = re.sub(r'\s+', ' ', remaining).strip()
+        remaining = _DUAL.sub('', remaining)
+        remaining = _WHITESPACE.sub(' ', remaining).strip()
 
     # Step 6c: Handle "single row" / "double row" for pin headers
     # Convert "16 pin header single row" -> Pin Structure = "1x16P"
     header_keywords = ("header", "pin header", "male header", "female header")
-    is_header = matched_keyword and any(kw in matched_keyword.lower() for kw in header_keywords)
-    is_header = is_header or (result.subcategory and "header" in result.subcategory.lower())
+    is_header = matched_keyword and any(kw in kw_lower for kw in header_keywords)
+    is_header = is_header or "header" in subcat_lower
 
-    if is_header and re.search(r'\b(single|1)\s*row\b', remaining, re.IGNORECASE):
+    if is_header and _SINGLE_ROW.search(remaining):
         # Find any "Number of Pins" filter and convert to "Pin Structure" with 1x prefix
         for i, sf in enumerate(result.spec_filters):
             if sf.name == "Number of Pins" and sf.value.endswith("P"):
@@ -299,10 +322,10 @@ def parse_smart_query(query: str) -> ParsedQuery:
                     result.spec_filters[i] = SpecFilter("Pin Structure", "=", f"1x{pin_count}P")
                     detected.setdefault("semantic", []).append(f"single row (-> Pin Structure=1x{pin_count}P)")
         # Remove "single row" from remaining text
-        remaining = re.sub(r'\b(single|1)\s*row\b', '', remaining, flags=re.IGNORECASE)
-        remaining = re.sub(r'\s+', ' ', remaining).strip()
+        remaining = _SINGLE_ROW.sub('', remaining)
+        remaining = _WHITESPACE.sub(' ', remaining).strip()
 
-    if is_header and re.search(r'\b(double|dual|2)\s*row\b', remaining, re.IGNORECASE):
+    if is_header and _DOUBLE_ROW.search(remaining):
         # Find any "Number of Pins" filter and convert to "Pin Structure" with 2x prefix
         # Note: for double row, the total pins = 2 * pins_per_row, so we need to divide
         for i, sf in enumerate(result.spec_filters):
@@ -314,29 +337,29 @@ def parse_smart_query(query: str) -> ParsedQuery:
                     result.spec_filters[i] = SpecFilter("Pin Structure", "=", f"2x{pins_per_row}P")
                     detected.setdefault("semantic", []).append(f"double row (-> Pin Structure=2x{pins_per_row}P)")
         # Remove "double/dual row" from remaining text
-        remaining = re.sub(r'\b(double|dual|2)\s*row\b', '', remaining, flags=re.IGNORECASE)
-        remaining = re.sub(r'\s+', ' ', remaining).strip()
+        remaining = _DOUBLE_ROW.sub('', remaining)
+        remaining = _WHITESPACE.sub(' ', remaining).strip()
 
     # Step 7: Clean up remaining text
     # Step 7a: Replace connector-specific synonyms
     # "magnetics" is a common term for RJ45 connectors with integrated magnetics (transformers)
     # JLCPCB lists these as "Filtered" in descriptions
-    if subcategory and 'connector' in subcategory.lower():
-        remaining = re.sub(r'\bmagnetics?\b', 'filtered', remaining, flags=re.IGNORECASE)
+    if 'connector' in subcategory_lower:
+        remaining = _MAGNETICS.sub('filtered', remaining)
 
     remaining = remove_noise_words(remaining)
 
     # Step 7b: Remove connector-specific noise words when in connector context
     # Words like "power", "data", "signal" describe USB-C functionality but aren't searchable
     # Also applies to pin headers (male/female not indexed in descriptions)
-    if subcategory and ('connector' in subcategory.lower() or 'header' in subcategory.lower()):
+    if 'connector' in subcategory_lower or 'header' in subcategory_lower:
         words = remaining.split()
         remaining = ' '.join(w for w in words if w.lower() not in CONNECTOR_NOISE_WORDS)
 
     # Remove orphaned hyphens and single characters (e.g., "- -F" -> "")
-    remaining = re.sub(r'\b[A-Za-z]\b', '', remaining)  # Single letters
-    remaining = re.sub(r'\s*-\s*', ' ', remaining)  # Orphaned hyphens
-    remaining = re.sub(r'\s+', ' ', remaining).strip()
+    remaining = _SINGLE_LETTER.sub('', remaining)  # Single letters
+    remaining = _ORPHANED_HYPHEN.sub(' ', remaining)  # Orphaned hyphens
+    remaining = _WHITESPACE.sub(' ', remaining).strip()
 
     # Step 8: Determine what to use for FTS search
     # If we have a model number, use ONLY that for FTS (high precision)
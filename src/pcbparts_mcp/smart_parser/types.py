@@ -8,6 +8,13 @@ from ..subcategory_aliases import SUBCATEGORY_ALIASES
 # Pre-sorted by length (longest first) for correct matching
 _SUBCATEGORY_KEYWORDS_BY_LENGTH = sorted(SUBCATEGORY_ALIASES.keys(), key=len, reverse=True)
 
+# (keyword, lowercase keyword, word-boundary pattern), compiled once in the same order.
+# Use word boundaries to avoid "sram" matching inside "PSRAM"
+_SUBCATEGORY_KEYWORD_PATTERNS = [
+    (keyword, keyword.lower(), re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE))
+    for keyword in _SUBCATEGORY_KEYWORDS_BY_LENGTH
+]
+
 
 def extract_component_type(query: str) -> tuple[str | None, str, str | None]:
     """Extract component type from query.
@@ -20,10 +27,9 @@ def extract_component_type(query: str) -> tuple[str | None, str, str | None]:
     """
     query_lower = query.lower()
 
-    for keyword in _SUBCATEGORY_KEYWORDS_BY_LENGTH:
-        # Use word boundaries to avoid "sram" matching inside "PSRAM"
-        pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-        if pattern.search(query_lower):
+    for keyword, keyword_lower, pattern in _SUBCATEGORY_KEYWORD_PATTERNS:
+        # Cheap substring test first; only candidates pay for the boundary regex
+        if keyword_lower in query_lower and pattern.search(query_lower):
             # Remove the keyword from query
             remaining = pattern.sub('', query).strip()
             remaining = re.sub(r'\s+', ' ', remaining)
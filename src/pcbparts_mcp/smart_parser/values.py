@@ -62,31 +62,37 @@ _POSITION = re.compile(r'\b(\d+)\s*-?\s*(?:pos(?:ition)?|way|P)\b', re.IGNORECAS
 # Header pin structure: 1x7, 2x20, 1X40 (rows x pins per row)
 _PIN_STRUCTURE = re.compile(r'\b([12])\s*[xX]\s*(\d+)\b')
 
+# Any digit (every value pattern above contains one)
+_DIGIT = re.compile(r'\d')
+
+# Unit tables: matched suffix/prefix -> (multiplier to base units, normalized suffix)
+# Anything not listed is taken as the bare base unit
+_RES_EURO_UNITS = {'R': (1, 'R'), 'K': (1000, 'k'), 'M': (1_000_000, 'M')}
+_RES_STD_UNITS = {
+    'R': (1, 'Ohm'), 'OHM': (1, 'Ohm'),
+    'K': (1000, 'kOhm'), 'KOHM': (1000, 'kOhm'),
+    'M': (1_000_000, 'MOhm'), 'MOHM': (1_000_000, 'MOhm'),
+}
+_FREQ_UNITS = {'K': (1e3, 'kHz'), 'M': (1e6, 'MHz'), 'G': (1e9, 'GHz')}
+_CAP_UNITS = {'uf': (1e-6, 'uF'), 'f': (1e-6, 'uF'), 'nf': (1e-9, 'nF'), 'pf': (1e-12, 'pF')}
+_IND_UNITS = {'uh': (1e-6, 'uH'), 'h': (1e-6, 'uH'), 'nh': (1e-9, 'nH'), 'mh': (1e-3, 'mH')}
+_CURR_UNITS = {'u': (1e-6, 'uA'), 'm': (1e-3, 'mA')}
+_POWER_UNITS = {'m': (1e-3, 'mW')}
+
 
 def _parse_resistance_value(match: re.Match) -> tuple[float, str]:
     """Parse resistance match to (ohms, normalized_string)."""
     groups = match.groups()
     if len(groups) == 3 and groups[2]:  # European notation: 4k7
         int_part, suffix, frac_part = groups
-        value = float(f"{int_part}.{frac_part}")
-        suffix = suffix.upper()
-        if suffix == 'R':
-            return value, f"{int_part}R{frac_part}"
-        elif suffix == 'K':
-            return value * 1000, f"{int_part}k{frac_part}"
-        elif suffix == 'M':
-            return value * 1_000_000, f"{int_part}M{frac_part}"
+        unit = _RES_EURO_UNITS.get(suffix.upper())
+        if unit:
+            multiplier, letter = unit
+            return float(f"{int_part}.{frac_part}") * multiplier, f"{int_part}{letter}{frac_part}"
     else:  # Standard: 10k, 100R
         value_str = groups[0]
-        suffix = (groups[1] or '').upper()
-        value = float(value_str)
-        if suffix in ('R', 'OHM'):
-            return value, f"{value_str}Ohm"
-        elif suffix in ('K', 'KOHM'):
-            return value * 1000, f"{value_str}kOhm"
-        elif suffix in ('M', 'MOHM'):
-            return value * 1_000_000, f"{value_str}MOhm"
-        return value, f"{value_str}Ohm"
+        multiplier, unit = _RES_STD_UNITS.get((groups[1] or '').upper(), (1, 'Ohm'))
+        return float(value_str) * multiplier, f"{value_str}{unit}"
     return 0, ""
 
 
@@ -99,6 +105,10 @@ def extract_values(query: str) -> tuple[list[ExtractedValue], str]:
     Returns:
         Tuple of (list of ExtractedValue, remaining_query with values removed)
     """
+    # Every value pattern needs a digit; skip all the scans for word-only queries
+    if not _DIGIT.search(query):
+        return [], query
+
     values = []
     remaining = query
 
@@ -117,24 +127,12 @@ def extract_values(query: str) -> tuple[list[ExtractedValue], str]:
 
     # Frequency (before generic numbers)
     for match in _FREQ.finditer(query):
-        value = float(match.group(1))
-        suffix = (match.group(2) or '').upper()
-        if suffix == 'K':
-            value *= 1e3
-            norm = f"{match.group(1)}kHz"
-        elif suffix == 'M':
-            value *= 1e6
-            norm = f"{match.group(1)}MHz"
-        elif suffix == 'G':
-            value *= 1e9
-            norm = f"{match.group(1)}GHz"
-        else:
-            norm = f"{match.group(1)}Hz"
+        multiplier, unit = _FREQ_UNITS.get((match.group(2) or '').upper(), (1, 'Hz'))
         extractions.append((match.start(), match.end(), ExtractedValue(
             raw=match.group(0),
-            value=value,
+            value=float(match.group(1)) * multiplier,
             unit_type="frequency",
-            normalized=norm
+            normalized=f"{match.group(1)}{unit}"
         )))
 
     # Resistance (European notation first)
@@ -162,48 +160,22 @@ def extract_values(query: str) -> tuple[list[ExtractedValue], str]:
 
     # Capacitance
     for match in _CAP.finditer(query):
-        value = float(match.group(1))
-        suffix = match.group(2).lower()
-        if suffix in ('uf', 'f'):
-            farads = value * 1e-6
-            norm = f"{match.group(1)}uF"
-        elif suffix == 'nf':
-            farads = value * 1e-9
-            norm = f"{match.group(1)}nF"
-        elif suffix == 'pf':
-            farads = value * 1e-12
-            norm = f"{match.group(1)}pF"
-        else:
-            farads = value
-            norm = f"{match.group(1)}F"
+        multiplier, unit = _CAP_UNITS.get(match.group(2).lower(), (1, 'F'))
         extractions.append((match.start(), match.end(), ExtractedValue(
             raw=match.group(0),
-            value=farads,
+            value=float(match.group(1)) * multiplier,
             unit_type="capacitance",
-            normalized=norm
+            normalized=f"{match.group(1)}{unit}"
         )))
 
     # Inductance
     for match in _IND.finditer(query):
-        value = float(match.group(1))
-        suffix = match.group(2).lower()
-        if suffix in ('uh', 'h'):
-            henries = value * 1e-6
-            norm = f"{match.group(1)}uH"
-        elif suffix == 'nh':
-            henries = value * 1e-9
-            norm = f"{match.group(1)}nH"
-        elif suffix == 'mh':
-            henries = value * 1e-3
-            norm = f"{match.group(1)}mH"
-        else:
-            henries = value
-            norm = f"{match.group(1)}H"
+        multiplier, unit = _IND_UNITS.get(match.group(2).lower(), (1, 'H'))
         extractions.append((match.start(), match.end(), ExtractedValue(
             raw=match.group(0),
-            value=henries,
+            value=float(match.group(1)) * multiplier,
             unit_type="inductance",
-            normalized=norm
+            normalized=f"{match.group(1)}{unit}"
         )))
 
     # Voltage (be careful not to match model numbers like STM32F103)
@@ -227,22 +199,12 @@ def extract_values(query: str) -> tuple[list[ExtractedValue], str]:
 
     # Current
     for match in _CURR.finditer(query):
-        value = float(match.group(1))
-        prefix = (match.group(2) or '').lower()
-        if prefix == 'u':
-            amps = value * 1e-6
-            norm = f"{match.group(1)}uA"
-        elif prefix == 'm':
-            amps = value * 1e-3
-            norm = f"{match.group(1)}mA"
-        else:
-            amps = value
-            norm = f"{match.group(1)}A"
+        multiplier, unit = _CURR_UNITS.get((match.group(2) or '').lower(), (1, 'A'))
         extractions.append((match.start(), match.end(), ExtractedValue(
             raw=match.group(0),
-            value=amps,
+            value=float(match.group(1)) * multiplier,
             unit_type="current",
-            normalized=norm
+            normalized=f"{match.group(1)}{unit}"
         )))
 
     # Power (fraction first)
@@ -259,19 +221,12 @@ def extract_values(query: str) -> tuple[list[ExtractedValue], str]:
     for match in _POWER.finditer(query):
         if any(s <= match.start() < e for s, e, _ in extractions):
             continue
-        value = float(match.group(1))
-        prefix = (match.group(2) or '').lower()
-        if prefix == 'm':
-            watts = value * 1e-3
-            norm = f"{match.group(1)}mW"
-        else:
-            watts = value
-            norm = f"{match.group(1)}W"
+        multiplier, unit = _POWER_UNITS.get((match.group(2) or '').lower(), (1, 'W'))
         extractions.append((match.start(), match.end(), ExtractedValue(
             raw=match.group(0),
-            value=watts,
+            value=float(match.group(1)) * multiplier,
             unit_type="power",
-            normalized=norm
+            normalized=f"{match.group(1)}{unit}"
         )))
 
     # Pin count (normalize to "XP" format to match database values like "8P", "16P")
@@ -549,20 +549,15 @@ def resolve_subcategory_name(
     if name_lower in name_to_id:
         return name_to_id[name_lower]
 
-    # Collect all partial matches (query contained in subcategory name)
-    matches: list[tuple[str, int]] = []
-    for subcat_name_lower, subcat_id in name_to_id.items():
-        if name_lower in subcat_name_lower:
-            matches.append((subcat_name_lower, subcat_id))
-
-    if not matches:
-        return None
-
-    # Return shortest match (most specific)
+    # Shortest partial match (query contained in subcategory name) is most specific
     # e.g., "crystal" matches both "crystals" and "crystal oscillators"
-    # "crystals" (8 chars) is shorter, so it wins
-    matches.sort(key=lambda x: len(x[0]))
-    return matches[0][1]
+    # "crystals" (8 chars) is shorter, so it wins. Single pass, first wins on ties.
+    best = min(
+        (item for item in name_to_id.items() if name_lower in item[0]),
+        key=lambda item: len(item[0]),
+        default=None,
+    )
+    return best[1] if best else None
 
 
 def find_similar_subcategories(
@@ -582,29 +577,24 @@ def find_similar_subcategories(
     Returns:
         List of similar subcategory dicts with id, name, category.
     """
-    name_lower = name.lower()
-    matches = []
+    # Query words worth matching (3+ chars), split once rather than per subcategory
+    words = [word for word in name.lower().split() if len(word) >= 3]
+    seen: set[int] = set()
+    unique: list[dict[str, Any]] = []
 
     for subcat_name_lower, subcat_id in name_to_id.items():
+        # Several names (aliases) can point at one ID; dedupe as we go and stop at the limit
+        if subcat_id in seen:
+            continue
         # Check if any word from the query appears in the subcategory name
-        words = name_lower.split()
-        for word in words:
-            if len(word) >= 3 and word in subcat_name_lower:
-                subcat_info = subcategory_info.get(subcat_id, {})
-                matches.append({
-                    "id": subcat_id,
-                    "name": subcat_info.get("name", subcat_name_lower),
-                    "category": subcat_info.get("category_name", ""),
-                })
-                break
-
-    # Dedupe and limit
-    seen: set[int] = set()
-    unique = []
-    for m in matches:
-        if m["id"] not in seen:
-            seen.add(m["id"])
-            unique.append(m)
+        if any(word in subcat_name_lower for word in words):
+            seen.add(subcat_id)
+            subcat_info = subcategory_info.get(subcat_id, {})
+            unique.append({
+                "id": subcat_id,
+                "name": subcat_info.get("name", subcat_name_lower),
+                "category": subcat_info.get("category_name", ""),
+            })
             if len(unique) >= limit:
                 break
 
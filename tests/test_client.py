@@ -1,5 +1,8 @@
 """Tests for JLCPCB API client."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from pcbparts_mcp.client import JLCPCBClient
 
@@ -348,6 +351,12 @@ class TestClient:
         """Singular form should match plural category."""
         assert client.match_category_by_name("resistor") == 1
 
+    def test_match_category_by_name_prefix(self, client):
+        """Prefixes of 4+ chars match, shorter ones do not."""
+        assert client.match_category_by_name("opto") == 16
+        assert client.match_category_by_name("Circuit Prot") == 11
+        assert client.match_category_by_name("opt") is None
+
     def test_match_category_by_name_no_match(self, client):
         """Non-matching query should return None."""
         assert client.match_category_by_name("xyz123") is None
@@ -392,6 +401,140 @@ class TestClient:
         # Whitespace
         assert await client.get_part("   ") is None
 
+    @pytest.mark.asyncio
+    async def test_check_easyeda_footprints_batch_dedupes(self, client):
+        """Batch EasyEDA check returns one result per unique code (invalid codes skip the API)."""
+        results = await client._check_easyeda_footprints(["BAD", "X1", "BAD"])
+        assert set(results) == {"BAD", "X1"}
+        assert all(r["has_easyeda_footprint"] is None for r in results.values())
+        assert await client._check_easyeda_footprints([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_categories_refresh_in_background(self, client):
+        """Stale API-fetched categories are served while a refresh runs in background."""
+        fresh = [{"id": 7, "name": "Crystals", "count": 1, "subcategories": []}]
+        # Externally set categories (fixture) are never refreshed
+        await client._ensure_categories()
+        assert client._category_refresh_task is None
+
+        client._categories_fetched_at = 0.0  # Pretend the API fetch is stale
+        with patch.object(client, "fetch_categories", return_value=fresh) as mock_fetch:
+            await client._ensure_categories()
+            # Stale data still served immediately
+            assert client.match_category_by_name("resistors") == 1
+            await client._category_refresh_task
+        mock_fetch.assert_called_once()
+        assert client.match_category_by_name("crystals") == 7
+        assert client._category_refresh_task is None
+        assert client._categories_fetched_at is not None
+
+    @pytest.mark.asyncio
+    async def test_cold_search_overlaps_category_fetch(self):
+        """Cold keyword search runs alongside the category fetch and is sent only once."""
+        sent = []
+
+        async def fake_fetch_categories():
+            await asyncio.sleep(0.01)
+            return [{"id": 1, "name": "Resistors", "count": 1, "subcategories": []}]
+
+        async def fake_send(url, params):
+            sent.append(params)
+            await asyncio.sleep(0.01)
+            return {"code": 200, "data": {"componentPageInfo": {"list": [], "total": 0}}}
+
+        cold = JLCPCBClient()
+        with patch.object(cold, "fetch_categories", side_effect=fake_fetch_categories), \
+                patch.object(cold, "_send_request", side_effect=fake_send):
+            result = await cold.search(query="ESP32")
+        assert result["total"] == 0
+        assert len(sent) == 1
+        assert sent[0]["keyword"] == "ESP32"
+        assert cold.match_category_by_name("resistors") == 1
+
+    @pytest.mark.asyncio
+    async def test_cold_subcategory_search_loads_categories(self):
+        """Cold subcategory filter waits for categories so IDs go out with their names."""
+        sent = []
+
+        async def fake_fetch_categories():
+            return [{"id": 1, "name": "Resistors", "count": 1, "subcategories": [
+                {"id": 2980, "name": "Chip Resistor - Surface Mount", "count": 1},
+            ]}]
+
+        async def fake_send(url, params):
+            sent.append(params)
+            return {"code": 200, "data": {"componentPageInfo": {"list": [], "total": 0}}}
+
+        cold = JLCPCBClient()
+        with patch.object(cold, "fetch_categories", side_effect=fake_fetch_categories), \
+                patch.object(cold, "_send_request", side_effect=fake_send):
+            await cold.search(subcategory_id=2980)
+            await cold.search(subcategory_id=999999)  # Unknown ID is not sent
+        assert sent[0]["firstSortName"] == "Resistors"
+        assert sent[0]["secondSortName"] == "Chip Resistor - Surface Mount"
+        assert "secondSortId" not in sent[1]
+
+    @pytest.mark.asyncio
+    async def test_request_dedupes_identical_calls(self, client):
+        """Identical concurrent/recent API requests share one HTTP call."""
+        calls = []
+
+        async def fake_send(url, params):
+            calls.append(params)
+            await asyncio.sleep(0.01)
+            return {"code": 200, "data": {"n": len(calls)}}
+
+        with patch.object(client, "_send_request", side_effect=fake_send):
+            params = {"keyword": "ESP32", "componentBrandList": ["Espressif"]}
+            first, second = await asyncio.gather(
+                client._request("u", dict(params)), client._request("u", dict(params))
+            )
+            assert first is second
+            assert len(calls) == 1
+            # Served from the short-lived response cache
+            assert await client._request("u", dict(params)) is first
+            assert len(calls) == 1
+            # Different params -> new request
+            await client._request("u", {"keyword": "STM32"})
+            assert len(calls) == 2
+        assert client._request_inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_request_dedupe_propagates_errors(self, client):
+        """Concurrent waiters see the owner's error, and errors are not cached."""
+        async def failing_send(url, params):
+            await asyncio.sleep(0.01)
+            raise ValueError("JLCPCB rate limited")
+
+        with patch.object(client, "_send_request", side_effect=failing_send) as mock_send:
+            results = await asyncio.gather(
+                client._request("u", {"keyword": "x"}),
+                client._request("u", {"keyword": "x"}),
+                return_exceptions=True,
+            )
+            assert all(isinstance(r, ValueError) for r in results)
+            assert mock_send.call_count == 1
+            with pytest.raises(ValueError):
+                await client._request("u", {"keyword": "x"})
+            assert mock_send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_check_easyeda_footprint_coalesces_inflight(self, client):
+        """Concurrent checks for the same part share a single EasyEDA request."""
+        calls = 0
+
+        async def fake_fetch(lcsc):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"has_easyeda_footprint": True, "easyeda_symbol_uuid": None, "easyeda_footprint_uuid": None}
+
+        with patch.object(client, "_fetch_easyeda_footprint", side_effect=fake_fetch):
+            results = await asyncio.gather(*(client.check_easyeda_footprint("C1525") for _ in range(3)))
+        assert calls == 1
+        assert all(r["has_easyeda_footprint"] is True for r in results)
+        assert client._easyeda_inflight == {}
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -92,6 +92,27 @@ class TestSearchWithNames:
         # Should use the ID, not the name
         assert result["filters_applied"]["subcategory_id"] == mosfet_id
 
+    def test_category_filter_without_subcategory_mapping(self):
+        """A category filter still applies when no category -> subcategories mapping is given."""
+        from pcbparts_mcp.search import SearchEngine
+        from pcbparts_mcp.search.query_builder import build_subcategory_clause
+
+        db = get_db()
+        db._ensure_db()
+        category_id = db.resolve_category_name("Resistors")
+        subcats = db._subcategories
+        expected = [sid for sid, info in subcats.items() if info["category_id"] == category_id]
+
+        assert build_subcategory_clause(None, category_id, subcats, {})[1] == expected
+        assert build_subcategory_clause(None, category_id, subcats, None)[1] == expected
+
+        engine = SearchEngine(
+            db._conn, subcats, db._categories, db._subcategory_name_to_id, db._category_name_to_id
+        )
+        result = engine.search(category_id=category_id, limit=20)
+        assert result["total"] > 0
+        assert all(part["category"] == "Resistors" for part in result["results"])
+
 
 class TestSpecFilters:
     """Test parametric spec filtering."""
@@ -200,6 +221,89 @@ class TestSpecFilterValidation:
             SpecFilter("Resistance", "~=", "10k")
 
 
+class TestSpecColumnLookup:
+    """Test spec name -> pre-computed column resolution."""
+
+    @pytest.fixture(scope="class")
+    def attribute_names(self):
+        """Every attribute name used by a part in the database."""
+        db = get_db()
+        db._ensure_db()
+        rows = db._conn.execute(
+            "SELECT DISTINCT j.value ->> 0 FROM components, json_each(components.attributes) j"
+        ).fetchall()
+        return [row[0] for row in rows if isinstance(row[0], str)]
+
+    def test_alias_and_full_name_share_column(self):
+        from pcbparts_mcp.search.spec_filter import get_spec_column
+
+        assert get_spec_column("Vds")[0] == "vds_max_v"
+        assert get_spec_column("Drain to Source Voltage")[0] == "vds_max_v"
+
+    def test_spelling_variants_share_column(self):
+        from pcbparts_mcp.search.spec_filter import get_spec_column
+
+        assert get_spec_column("Rds(on)")[0] == "rds_on_ohms"
+        assert get_spec_column("rds on")[0] == "rds_on_ohms"
+        assert get_spec_column("Current - Saturation (Isat)")[0] == "isat_a"
+
+    def test_spec_without_column(self):
+        from pcbparts_mcp.search.spec_filter import get_spec_column
+
+        assert get_spec_column("Vgs(th)") is None
+        assert get_spec_column("Type") is None
+
+    @pytest.mark.parametrize("spec_name", [
+        "Saturation Current",
+        "Ciss",
+        "Slew Rate",
+        "Lifetime",
+        "Noise Figure",
+        "Program Storage Size",
+        "Charge Current",
+        "Clamping Voltage@Ipp",
+        "Dominant Wavelength",
+    ])
+    def test_column_filled_for_every_spelling(self, spec_name, attribute_names):
+        """Every attribute spelling that resolves to the spec's column must have it filled."""
+        from pcbparts_mcp.search.spec_filter import get_spec_column
+
+        db = get_db()
+        column = get_spec_column(spec_name)[0]
+        spellings = [name for name in attribute_names if (get_spec_column(name) or ("",))[0] == column]
+        assert spellings
+
+        for attr_name in spellings:
+            present, filled = db._conn.execute(
+                f"SELECT count(*), count({column}) FROM components "
+                "WHERE instr(attributes, ?) AND NOT instr(attributes, ?)",
+                [f'"{attr_name}", ', f'"{attr_name}", "-"'],
+            ).fetchone()
+            if present:
+                assert filled / present >= 0.95, f"{column} filled for {filled}/{present} '{attr_name}' parts"
+
+    def test_unmeasured_spellings_not_routed(self):
+        """Specs whose columns the shipped database leaves NULL for some spellings stay on LIKE."""
+        from pcbparts_mcp.search.spec_filter import get_spec_column
+
+        for name in ("CMRR", "Common Mode Rejection Ratio (CMRR)", "Resolution(Bits)", "Resolution (Bits)"):
+            assert get_spec_column(name) is None
+
+    def test_empty_column_falls_back_to_post_filter(self):
+        """A column with no values in the database is filtered via LIKE + post-filter."""
+        from pcbparts_mcp.search.query_builder import build_spec_filter_clauses, needs_numeric_post_filter
+
+        spec_filter = SpecFilter("Slew Rate", ">=", "1V/us")
+        empty = frozenset({"slew_rate_vus"})
+        sqls, params, post_filters = build_spec_filter_clauses([spec_filter], empty)
+
+        assert "slew_rate_vus" not in " ".join(sqls)
+        assert params == ['%"Slew Rate"%']
+        assert post_filters[0][2] is not None
+        assert needs_numeric_post_filter(spec_filter, empty)
+        assert not needs_numeric_post_filter(spec_filter)
+
+
 class TestLibraryTypeAndPreference:
     """Test library_type filter and prefer_no_fee sort preference."""
 
@@ -374,6 +478,14 @@ class TestFTSSearch:
         assert "error" not in result
         # AO3400 should match and have low Vgs(th)
 
+    def test_lcsc_code_query_matches_exact_part(self):
+        """An existing LCSC code should return that part, not every code sharing its prefix."""
+        db = get_db()
+        result = db.search(query="c1525", limit=10)
+
+        assert result["total"] == 1
+        assert result["results"][0]["lcsc"] == "C1525"
+
 
 class TestSubcategoryAliases:
     """Test subcategory alias resolution."""
@@ -515,6 +627,16 @@ class TestLibraryTypeCounts:
         assert result["library_type_counts"]["preferred"] == 0
         assert result["no_fee_available"] is False
 
+    def test_counts_from_complete_page_match_count_query(self):
+        """A page holding every match should report the same counts as the count query."""
+        db = get_db()
+        counted = db.search(subcategory_name="MOSFETs", query="AO3400", limit=1)
+        complete = db.search(subcategory_name="MOSFETs", query="AO3400", limit=100)
+
+        assert 1 < complete["total"] == len(complete["results"]) < 100
+        assert complete["total"] == counted["total"]
+        assert complete["library_type_counts"] == counted["library_type_counts"]
+
 
 class TestErrorMessagesWithSuggestions:
     """Test improved error messages with suggestions."""
@@ -695,6 +817,50 @@ class TestDatabaseStats:
         assert stats["subcategories"] > 0  # Should have subcategories
 
 
+class TestSchemaUpgrade:
+    """Test in-place upgrade of databases built by an older build script."""
+
+    def test_adds_library_type_order(self, tmp_path):
+        import sqlite3
+
+        from pcbparts_mcp.db.connection import upgrade_schema
+
+        conn = sqlite3.connect(tmp_path / "old.db")
+        conn.execute("CREATE TABLE components (lcsc TEXT PRIMARY KEY, stock INTEGER, library_type TEXT, subcategory_id INTEGER)")
+        conn.executemany(
+            "INSERT INTO components VALUES (?, ?, ?, 1)",
+            [("C1", 500, "e"), ("C2", 10, "b"), ("C3", 100, "p")],
+        )
+
+        upgrade_schema(conn)
+        upgrade_schema(conn)  # Already current: no-op
+
+        rows = conn.execute("SELECT lcsc FROM components ORDER BY library_type_order, stock DESC").fetchall()
+        assert [r[0] for r in rows] == ["C2", "C3", "C1"]
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(components)")}
+        assert {"idx_ltorder_stock", "idx_subcat_ltorder_stock"} <= indexes
+
+    def test_read_only_database_falls_back_to_case(self, tmp_path):
+        import sqlite3
+
+        from pcbparts_mcp.db.connection import upgrade_schema
+        from pcbparts_mcp.search.query_builder import LIBRARY_TYPE_ORDER_CASE, build_sort_clause
+
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE components (lcsc TEXT PRIMARY KEY, stock INTEGER, library_type TEXT)")
+        conn.executemany("INSERT INTO components VALUES (?, ?, ?)", [("C1", 500, "e"), ("C2", 10, "b")])
+        conn.commit()
+        conn.close()
+
+        read_only = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        assert upgrade_schema(read_only) is False
+
+        order_by = build_sort_clause("stock", True, False, LIBRARY_TYPE_ORDER_CASE)
+        rows = read_only.execute(f"SELECT lcsc FROM components {order_by}").fetchall()
+        assert [r[0] for r in rows] == ["C2", "C1"]
+
+
 class TestSmartQueryParsing:
     """Test smart query parsing for natural language queries."""
 
@@ -415,3 +415,16 @@ class TestConnectorParserIntegration:
         assert result.connector_spec.series == "SH"
         assert result.connector_spec.pitch == 1.0
         assert result.connector_spec.pins == 4
+
+
+class TestSmartQueryCache:
+    """Repeated queries are memoized but each caller gets its own containers."""
+
+    def test_repeated_query_returns_independent_results(self):
+        from pcbparts_mcp.smart_parser.parser import parse_smart_query
+        first = parse_smart_query("10k resistor 0603 1%")
+        first.spec_filters.clear()
+        first.detected.clear()
+        second = parse_smart_query("10k resistor 0603 1%")
+        assert second.spec_filters
+        assert second.detected["package"] == "0603"
@@ -105,3 +105,17 @@ class TestNormalizeMpn:
             v_upper = v.upper()
             assert v_upper not in seen_upper, f"Duplicate variant: {v}"
             seen_upper.add(v_upper)
+
+
+class TestExpandQuerySynonyms:
+    """Tests for query synonym expansion."""
+
+    def test_connector_aliases_map_to_ipex(self):
+        from pcbparts_mcp.search.resolvers import expand_query_synonyms
+        assert expand_query_synonyms("U.FL connector") == "IPEX connector"
+        assert expand_query_synonyms("hirose u.fl cable") == "hirose IPEX cable"
+        assert expand_query_synonyms("mhf or ipx") == "IPEX or IPEX"
+
+    def test_unrelated_query_unchanged(self):
+        from pcbparts_mcp.search.resolvers import expand_query_synonyms
+        assert expand_query_synonyms("esp32") == "esp32"